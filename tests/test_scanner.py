@@ -6,6 +6,8 @@ import pytest
 import tempfile
 import os
 import stat
+import json
+import time
 from pathlib import Path
 from unsafe_file_scanner import UnsafeFileScanner, UnsafeFile
 
@@ -30,6 +32,13 @@ class TestUnsafeFileScanner:
         assert hasattr(self.scanner, 'unsafe_files')
         assert hasattr(self.scanner, 'scan_stats')
     
+    def test_config_overrides(self):
+        """Test constructor overrides take precedence over defaults"""
+        scanner = UnsafeFileScanner(overrides={'exclude_files': ['skip.txt'], 'scan_threads': 4})
+        assert scanner.config['scan_threads'] == 4
+        assert scanner.is_excluded(os.path.join(self.temp_dir, 'skip.txt'))
+        assert not scanner.is_excluded(os.path.join(self.temp_dir, '.DS_Store'))
+    
     def test_scan_nonexistent_directory(self):
         """Test scanning a non-existent directory"""
         with pytest.raises(FileNotFoundError):
@@ -103,6 +112,88 @@ class TestUnsafeFileScanner:
         assert self.scanner.scan_stats['unsafe_files'] >= 1
         assert self.scanner.scan_stats['sgid_files'] >= 1
     
+    def test_symlinks_not_reported_unless_followed(self):
+        """Test symlinks are skipped when not following links"""
+        test_file = os.path.join(self.temp_dir, 'target.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.symlink(test_file, os.path.join(self.temp_dir, 'link.txt'))
+        
+        self.scanner.scan_directory(self.temp_dir)
+        
+        assert self.scanner.scan_stats['total_files'] == 1
+        assert self.scanner.unsafe_files == []
+    
+    def test_scan_statistics(self):
+        """Test that statistics are tallied per issue type"""
+        for name, mode in (('suid_file', 0o4755), ('sgid_file', 0o2755), ('shared.txt', 0o666)):
+            file_path = os.path.join(self.temp_dir, name)
+            with open(file_path, 'w') as f:
+                f.write('test content')
+            os.chmod(file_path, mode)
+        
+        self.scanner.scan_directory(self.temp_dir)
+        
+        assert self.scanner.scan_stats['total_files'] == 3
+        assert self.scanner.scan_stats['unsafe_files'] == 3
+        assert self.scanner.scan_stats['suid_files'] == 1
+        assert self.scanner.scan_stats['sgid_files'] == 1
+        assert self.scanner.scan_stats['world_writable'] == 1
+    
+    def test_scan_directory_parallel(self):
+        """Test that the threaded walk finds the same files as the serial one"""
+        for name in ('a', 'b'):
+            sub_dir = os.path.join(self.temp_dir, name)
+            os.makedirs(sub_dir)
+            for i in range(3):
+                file_path = os.path.join(sub_dir, f'file_{i}.txt')
+                with open(file_path, 'w') as f:
+                    f.write('test content')
+                os.chmod(file_path, 0o666 if i == 0 else 0o644)
+        
+        self.scanner.scan_directory(self.temp_dir)
+        serial_paths = sorted(f.path for f in self.scanner.unsafe_files)
+        
+        parallel_scanner = UnsafeFileScanner()
+        parallel_scanner.scan_directory_parallel(self.temp_dir, threads=4)
+        parallel_paths = sorted(f.path for f in parallel_scanner.unsafe_files)
+        
+        assert parallel_paths == serial_paths
+        assert len(parallel_paths) == 2
+        assert parallel_scanner.scan_stats['total_files'] == 6
+    
+    def test_scan_directories_parallel(self):
+        """Test several roots scanned with one shared pool"""
+        roots = [os.path.join(self.temp_dir, name) for name in ('a', 'b')]
+        for root in roots:
+            os.makedirs(os.path.join(root, 'sub'))
+            test_file = os.path.join(root, 'sub', 'test.txt')
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.chmod(test_file, 0o666)
+        
+        self.scanner.scan_directories_parallel(roots, threads=4)
+        
+        assert self.scanner.scan_stats['total_files'] == 2
+        assert sorted(f.path for f in self.scanner.unsafe_files) == sorted(
+            os.path.join(root, 'sub', 'test.txt') for root in roots
+        )
+    
+    def test_may_be_unsafe(self):
+        """Test the quick pre-check agrees with scan_file"""
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        self.scanner.rule_engine = None
+        
+        os.chmod(test_file, 0o644)
+        assert not self.scanner.may_be_unsafe(test_file, os.stat(test_file))
+        assert self.scanner.scan_file(test_file) is None
+        
+        os.chmod(test_file, 0o666)
+        assert self.scanner.may_be_unsafe(test_file, os.stat(test_file))
+        assert self.scanner.scan_file(test_file) is not None
+    
     def test_generate_report(self):
         """Test report generation"""
         # Create a test file
@@ -168,6 +259,140 @@ class TestUnsafeFileScanner:
         
         assert os.path.exists(report_file)
         assert os.path.getsize(report_file) > 0
+    
+    def test_save_reports_multiple_formats(self):
+        """Test saving report in several formats at once"""
+        # Create a test file
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        
+        self.scanner.run_scan([self.temp_dir])
+        report = self.scanner.generate_report()
+        
+        # Save report
+        report_files = [
+            os.path.join(self.temp_dir, f'test_report{ext}')
+            for ext in ('.json', '.csv', '.html')
+        ]
+        self.scanner.save_reports(report, report_files)
+        
+        for report_file in report_files:
+            assert os.path.exists(report_file)
+            assert os.path.getsize(report_file) > 0
+    
+    def test_save_reports_raises_on_failure(self):
+        """Test a report that cannot be written is reported to the caller"""
+        report = self.scanner.generate_report()
+        report_file = os.path.join(self.temp_dir, 'test_report.json')
+        missing_file = os.path.join(self.temp_dir, 'missing', 'test_report.csv')
+        
+        with pytest.raises(RuntimeError, match='test_report.csv'):
+            self.scanner.save_reports(report, [report_file, missing_file])
+        
+        assert os.path.getsize(report_file) > 0
+    
+    def test_save_lazy_report_json(self):
+        """Test a lazily generated report is saved like a regular one"""
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.chmod(test_file, 0o666)
+        
+        self.scanner.scan_directory(self.temp_dir)
+        report = self.scanner.generate_report()
+        lazy_report = self.scanner.generate_report(lazy=True)
+        lazy_report['scan_info'] = report['scan_info']
+        
+        report_file = os.path.join(self.temp_dir, 'report.json')
+        lazy_report_file = os.path.join(self.temp_dir, 'lazy_report.json')
+        self.scanner.save_report(report, report_file)
+        self.scanner.save_report(lazy_report, lazy_report_file)
+        
+        with open(report_file, 'rb') as f, open(lazy_report_file, 'rb') as lazy_f:
+            assert lazy_f.read() == f.read()
+    
+    def test_run_scan_streams_ndjson_report(self):
+        """Test NDJSON reports are written during the scan"""
+        for name in ('a.txt', 'b.txt'):
+            test_file = os.path.join(self.temp_dir, name)
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.chmod(test_file, 0o666)
+        
+        report_file = os.path.join(self.temp_dir, 'report.ndjson')
+        self.scanner.config['output_file'] = report_file
+        self.scanner.run_scan([self.temp_dir])
+        
+        with open(report_file) as f:
+            records = [json.loads(line) for line in f]
+        
+        assert sorted(os.path.basename(r['path']) for r in records) == ['a.txt', 'b.txt']
+        assert self.scanner.unsafe_files == []
+        assert self.scanner.scan_stats['unsafe_files'] == 2
+    
+    def test_stopped_scan_skips_directories(self):
+        """Test a stopped scanner does not walk further directories"""
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.chmod(test_file, 0o666)
+        
+        self.scanner.stop()
+        self.scanner.run_scan([self.temp_dir])
+        
+        assert self.scanner.stopped
+        assert self.scanner.scan_stats['total_files'] == 0
+        assert len(self.scanner.unsafe_files) == 0
+    
+    def test_run_scan_streams_json_report(self):
+        """Test JSON reports are written during the scan with stream_output"""
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.chmod(test_file, 0o666)
+        
+        report_file = os.path.join(self.temp_dir, 'report.json')
+        self.scanner.config['output_file'] = report_file
+        self.scanner.config['stream_output'] = True
+        self.scanner.run_scan([self.temp_dir])
+        
+        with open(report_file) as f:
+            report = json.load(f)
+        
+        assert [r['path'] for r in report['unsafe_files']] == [test_file]
+        assert report['summary']['total_unsafe_files'] == 1
+        assert report['statistics'] == self.scanner.scan_stats
+        assert self.scanner.unsafe_files == []
+    
+    def test_run_scan_streams_json_report_twice(self):
+        """Test a second streamed scan on the same scanner writes a valid report"""
+        test_file = os.path.join(self.temp_dir, 'test.txt')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.chmod(test_file, 0o666)
+        
+        report_file = os.path.join(self.temp_dir, 'report.json')
+        self.scanner.config['output_file'] = report_file
+        self.scanner.config['stream_output'] = True
+        self.scanner.run_scan([self.temp_dir])
+        self.scanner.run_scan([self.temp_dir])
+        
+        with open(report_file) as f:
+            report = json.load(f)
+        
+        assert [r['path'] for r in report['unsafe_files']] == [test_file]
+        assert report['summary']['total_unsafe_files'] == 1
+    
+    def test_gui_report_json_without_orjson(self, monkeypatch):
+        """Test the GUI's JSON text falls back to the json module"""
+        pytest.importorskip('tkinter')
+        from unsafe_file_scanner import unsafe_file_scanner_gui as gui
+        
+        monkeypatch.setattr(gui, 'ORJSON_AVAILABLE', False)
+        report = {'summary': {'total_unsafe_files': 0}, 'unsafe_files': []}
+        
+        assert gui._report_json(report) == json.dumps(report, indent=2)
 
 
 class TestUnsafeFile:
@@ -225,5 +450,196 @@ class TestUnsafeFile:
         assert file_dict['issues'] == ["World-writable"]
 
 
+class TestUnsafeFileEventHandler:
+    """Test cases for the real-time monitor's event handler"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        pytest.importorskip('watchdog')
+        from unsafe_file_scanner.realtime_monitor import UnsafeFileEventHandler
+        
+        self.scanner = UnsafeFileScanner(overrides={'debounce_ms': 50})
+        self.handler = UnsafeFileEventHandler(self.scanner)
+        self.checked = []
+        self.handler._check_file = self.checked.append
+    
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        self.handler.close()
+    
+    def wait_until_idle(self, timeout=5.0):
+        """Wait until no file is pending or being checked"""
+        deadline = time.monotonic() + timeout
+        while self.handler._pending or self.handler._in_flight:
+            assert time.monotonic() < deadline, "pending checks did not finish"
+            time.sleep(0.01)
+    
+    def test_event_bursts_checked_once(self):
+        """Test repeated events for a file lead to a single check"""
+        from watchdog.events import FileCreatedEvent, FileModifiedEvent
+        
+        self.handler.on_created(FileCreatedEvent('/tmp/a.txt'))
+        for _ in range(5):
+            self.handler.on_modified(FileModifiedEvent('/tmp/a.txt'))
+        self.handler.on_modified(FileModifiedEvent('/tmp/b.txt'))
+        
+        self.wait_until_idle()
+        assert sorted(self.checked) == ['/tmp/a.txt', '/tmp/b.txt']
+    
+    def test_deleted_file_not_checked(self):
+        """Test a file deleted before its events settle is not checked"""
+        from watchdog.events import FileCreatedEvent, FileDeletedEvent
+        
+        self.handler.on_created(FileCreatedEvent('/tmp/a.txt'))
+        self.handler.on_deleted(FileDeletedEvent('/tmp/a.txt'))
+        
+        self.wait_until_idle()
+        assert self.checked == []
+    
+    def test_unchanged_file_skipped(self):
+        """Test a file is only rechecked after its state changes"""
+        fd, test_file = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            assert self.handler._changed_since_last_check(test_file, os.stat(test_file))
+            assert not self.handler._changed_since_last_check(test_file, os.stat(test_file))
+            
+            os.chmod(test_file, 0o666)
+            assert self.handler._changed_since_last_check(test_file, os.stat(test_file))
+        finally:
+            os.unlink(test_file)
+    
+    def test_check_file_records_unsafe_file(self):
+        """Test a world-writable file is recorded and counted"""
+        fd, test_file = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            os.chmod(test_file, 0o666)
+            type(self.handler)._check_file(self.handler, test_file)
+        finally:
+            os.unlink(test_file)
+        
+        assert [f.path for f in self.handler.findings] == [test_file]
+        assert self.scanner.scan_stats['unsafe_files'] == 1
+        assert self.scanner.scan_stats['world_writable'] == 1
+    
+    def test_file_made_unsafe_again_reported(self):
+        """Test a file reported, made safe and made unsafe again is reported twice"""
+        fd, test_file = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            for mode in (0o666, 0o644, 0o666):
+                os.chmod(test_file, mode)
+                type(self.handler)._check_file(self.handler, test_file)
+        finally:
+            os.unlink(test_file)
+        
+        assert [f.path for f in self.handler.findings] == [test_file, test_file]
+    
+    def test_exclude_patterns(self):
+        """Test files matching any exclude pattern are skipped"""
+        from unsafe_file_scanner.realtime_monitor import UnsafeFileEventHandler
+        
+        self.scanner.config['exclude_patterns'] = ['.tmp', '/cache/']
+        handler = UnsafeFileEventHandler(self.scanner)
+        try:
+            assert handler._should_exclude_file('/data/report.tmp')
+            assert handler._should_exclude_file('/data/cache/file.txt')
+            assert not handler._should_exclude_file('/data/report.txt')
+        finally:
+            handler.close()
+    
+    def test_resync_reports_changes_after_baseline(self):
+        """Test a resync only reports files changed since the first one"""
+        from unsafe_file_scanner.realtime_monitor import RealTimeMonitor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, 'test.txt')
+            Path(test_file).touch()
+            os.chmod(test_file, 0o666)
+            
+            monitor = RealTimeMonitor(self.scanner)
+            monitor.event_handler = self.handler
+            monitor.monitored_dirs = [temp_dir]
+            
+            monitor.resync(alert=False)
+            monitor.resync()
+            assert list(self.handler.findings) == []
+            
+            os.chmod(test_file, 0o646)
+            monitor.resync()
+            assert [f.path for f in self.handler.findings] == [test_file]
+    
+    def test_resync_baseline_covers_large_trees(self):
+        """Test unchanged files are not reported when the tree outgrows the event LRU"""
+        from unsafe_file_scanner.realtime_monitor import RealTimeMonitor, LAST_SEEN_SIZE
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(LAST_SEEN_SIZE + 100):
+                test_file = os.path.join(temp_dir, f'test{i}.txt')
+                Path(test_file).touch()
+                os.chmod(test_file, 0o666)
+            
+            monitor = RealTimeMonitor(self.scanner)
+            monitor.event_handler = self.handler
+            monitor.monitored_dirs = [temp_dir]
+            
+            monitor.resync(alert=False)
+            monitor.resync()
+            monitor.resync()
+            
+            assert list(self.handler.findings) == []
+            assert self.scanner.scan_stats['unsafe_files'] == 0
+    
+    def test_resync_baseline_skips_files_changed_since_start(self):
+        """Test the baseline leaves files changed after the start to their events"""
+        from unsafe_file_scanner.realtime_monitor import RealTimeMonitor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, 'test.txt')
+            Path(test_file).touch()
+            
+            monitor = RealTimeMonitor(self.scanner)
+            monitor.event_handler = self.handler
+            monitor.monitored_dirs = [temp_dir]
+            monitor._started_ns = time.time_ns()
+            
+            os.chmod(test_file, 0o666)
+            monitor.resync(alert=False)
+            type(self.handler)._check_file(self.handler, test_file)
+            
+            assert [f.path for f in self.handler.findings] == [test_file]
+    
+    def test_resync_ignores_stopped_scan(self):
+        """Test a stopped batch scan does not stop the monitor's resync"""
+        from unsafe_file_scanner.realtime_monitor import RealTimeMonitor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, 'test.txt')
+            Path(test_file).touch()
+            os.chmod(test_file, 0o666)
+            
+            monitor = RealTimeMonitor(self.scanner)
+            monitor.event_handler = self.handler
+            monitor.monitored_dirs = [temp_dir]
+            
+            self.scanner.stop()
+            monitor.resync()
+            
+            assert [f.path for f in self.handler.findings] == [test_file]
+    
+    def test_nested_watch_roots_dropped(self):
+        """Test directories inside another monitored directory are not watched again"""
+        from unsafe_file_scanner.realtime_monitor import RealTimeMonitor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sub_dir = os.path.join(temp_dir, 'sub')
+            os.mkdir(sub_dir)
+            
+            monitor = RealTimeMonitor(self.scanner)
+            roots = monitor._watch_roots([sub_dir, temp_dir, temp_dir + ' 2', temp_dir])
+            assert roots == [os.path.abspath(temp_dir)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
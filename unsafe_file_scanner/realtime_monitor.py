@@ -5,16 +5,20 @@ Uses watchdog library for cross-platform file system monitoring
 """
 
 import os
+import re
 import time
+import queue
 import logging
 import threading
-from pathlib import Path
-from typing import List, Dict, Callable, Optional
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Callable, Optional, Set
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+    from watchdog.events import (
+        FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent, FileMovedEvent, FileDeletedEvent
+    )
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
@@ -23,6 +27,33 @@ except ImportError:
     FileCreatedEvent = None
     FileModifiedEvent = None
     FileMovedEvent = None
+    FileDeletedEvent = None
+
+# Event types the handler acts on. watchdog 4+ passes these to the OS (as
+# the inotify mask on Linux), so opens, reads and closes are never delivered
+HANDLED_EVENTS = [FileCreatedEvent, FileModifiedEvent, FileMovedEvent, FileDeletedEvent]
+
+# Threads checking settled files; stat calls on slow mounts overlap
+CHECK_WORKERS = 4
+
+# Files whose last checked state is remembered to skip no-op events. Only
+# event checks use it; an evicted file's next event is simply checked in
+# full. Resyncs walk whole trees and keep their own, untrimmed baseline
+LAST_SEEN_SIZE = 4096
+
+# Files changed this close to the start of monitoring are left out of the
+# resync baseline, so it never hides a change an event is about to report
+BASELINE_MARGIN_NS = 1_000_000_000
+
+# Alerts waiting for the GUI thread, and how often it collects them
+GUI_QUEUE_SIZE = 1000
+GUI_POLL_MS = 50
+
+
+def _file_state(stat_info: os.stat_result) -> tuple:
+    """Return the parts of a stat result the checks look at."""
+    return (stat_info.st_mtime_ns, stat_info.st_mode, stat_info.st_uid,
+            stat_info.st_gid, stat_info.st_size)
 
 
 class UnsafeFileEventHandler(FileSystemEventHandler):
@@ -33,20 +64,122 @@ class UnsafeFileEventHandler(FileSystemEventHandler):
         self.callback = callback
         self.logger = logging.getLogger(__name__)
         
+        # All exclude patterns as one alternation, matched in a single pass
+        patterns = scanner.config.get('exclude_patterns', [])
+        self._exclude_re = re.compile("|".join(map(re.escape, patterns))) if patterns else None
+        
+        # Paths waiting for their events to settle, mapped to when to check them
+        self.debounce = scanner.config.get('debounce_ms', 100) / 1000
+        self._pending: Dict[str, float] = {}
+        self._pending_lock = threading.Lock()
+        self._timer = None
+        
+        # Settled paths are checked on a pool, so the observer thread only
+        # records events; a path is never checked twice at the same time
+        self._executor = ThreadPoolExecutor(max_workers=CHECK_WORKERS)
+        self._in_flight: Set[str] = set()
+        self._results_lock = threading.Lock()
+        
+        # Most recent findings; every alert is also logged, so older ones
+        # dropped from here are still on record in the log file
+        self.findings = deque(maxlen=scanner.config.get('realtime_history', 10000))
+        
+        # path -> (mtime_ns, mode, uid, gid, size) at its last event check
+        self._last_seen: "OrderedDict[str, tuple]" = OrderedDict()
+        
+        # The same state for every file that may be unsafe, compared by
+        # resyncs; never trimmed, so a walk cannot evict its own baseline
+        self._resync_seen: Dict[str, tuple] = {}
+        
     def on_created(self, event):
         """Handle file creation events."""
         if not event.is_directory:
-            self._check_file(event.src_path)
+            self._schedule_check(event.src_path)
     
     def on_modified(self, event):
         """Handle file modification events."""
         if not event.is_directory:
-            self._check_file(event.src_path)
+            self._schedule_check(event.src_path)
     
     def on_moved(self, event):
         """Handle file move/rename events."""
         if not event.is_directory:
-            self._check_file(event.dest_path)
+            self._drop_pending(event.src_path)
+            self._schedule_check(event.dest_path)
+    
+    def on_deleted(self, event):
+        """Handle file deletion events."""
+        if not event.is_directory:
+            self._drop_pending(event.src_path)
+    
+    def _schedule_check(self, file_path: str):
+        """Check a file once its events have been quiet for `debounce` seconds.
+        
+        Saves, git checkouts and rsync runs fire bursts of events for the
+        same file; each new event pushes its check back, so the burst costs
+        a single stat and permission check.
+        """
+        if self.debounce <= 0:
+            self._check_file(file_path)
+            return
+        
+        with self._pending_lock:
+            self._pending[file_path] = time.monotonic() + self.debounce
+            if self._timer is None:
+                self._start_timer(self.debounce)
+    
+    def _drop_pending(self, file_path: str):
+        """Forget a pending check for a file that no longer exists."""
+        with self._pending_lock:
+            self._pending.pop(file_path, None)
+    
+    def _start_timer(self, delay: float):
+        """Run _check_pending after delay seconds; call with _pending_lock held."""
+        self._timer = threading.Timer(delay, self._check_pending)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _check_pending(self):
+        """Hand every pending file whose events have settled to the pool."""
+        now = time.monotonic()
+        with self._pending_lock:
+            due = []
+            for path, deadline in list(self._pending.items()):
+                if deadline > now:
+                    continue
+                if path in self._in_flight:
+                    # Changed again while being checked; look once more later
+                    self._pending[path] = now + self.debounce
+                else:
+                    del self._pending[path]
+                    due.append(path)
+            self._in_flight.update(due)
+            
+            self._timer = None
+            if self._pending:
+                self._start_timer(max(0.0, min(self._pending.values()) - now))
+        
+        for path in due:
+            self._executor.submit(self._run_check, path)
+    
+    def _run_check(self, file_path: str):
+        """Check a settled file on a pool thread."""
+        try:
+            self._check_file(file_path)
+        except Exception:
+            self.logger.exception("Error checking %s", file_path)
+        finally:
+            with self._pending_lock:
+                self._in_flight.discard(file_path)
+    
+    def close(self):
+        """Drop all pending checks and stop the timer and check pool."""
+        with self._pending_lock:
+            self._pending.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._executor.shutdown(wait=False)
     
     def _check_file(self, file_path: str):
         """Check a single file for unsafe permissions."""
@@ -56,76 +189,104 @@ class UnsafeFileEventHandler(FileSystemEventHandler):
                 return
                 
             # Get file info
-            permissions, owner, group, size = self.scanner.get_file_permissions(file_path)
             stat_info = os.stat(file_path, follow_symlinks=self.scanner.config['follow_symlinks'])
-            
-            # Check for security issues
-            issues = []
-            issues.extend(self.scanner.check_suid_sgid(file_path, stat_info))
-            issues.extend(self.scanner.check_world_writable(file_path, stat_info))
-            issues.extend(self.scanner.check_non_owner_writable(file_path, stat_info))
-            issues.extend(self.scanner.check_other_permissions(file_path, stat_info))
-            
-            if issues:
-                # Determine risk level
-                risk_level = self.scanner.determine_risk_level(issues)
-                
-                # Create unsafe file object
-                unsafe_file = self.scanner.UnsafeFile(
-                    path=file_path,
-                    permissions=permissions,
-                    owner=owner,
-                    group=group,
-                    size=size,
-                    modified_time=datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                    issues=issues,
-                    risk_level=risk_level
-                )
-                
-                # Add to scanner results
-                self.scanner.unsafe_files.append(unsafe_file)
-                self.scanner.scan_stats['unsafe_files'] += 1
-                
-                # Update specific counters
-                if 'SUID bit set' in issues:
-                    self.scanner.scan_stats['suid_files'] += 1
-                if 'SGID bit set' in issues:
-                    self.scanner.scan_stats['sgid_files'] += 1
-                if 'World-writable' in issues or 'Potentially world-writable' in issues:
-                    self.scanner.scan_stats['world_writable'] += 1
-                if any('writable' in issue for issue in issues):
-                    self.scanner.scan_stats['non_owner_writable'] += 1
-                
-                # Log the finding
-                self.logger.warning(f"REAL-TIME ALERT: Unsafe file detected - {file_path}")
-                self.logger.warning(f"  Risk Level: {risk_level}")
-                self.logger.warning(f"  Issues: {', '.join(issues)}")
-                
-                # Call callback if provided
-                if self.callback:
-                    self.callback(unsafe_file)
+            self.check_stat(file_path, stat_info)
                     
         except (OSError, PermissionError) as e:
-            self.logger.debug(f"Could not check file {file_path}: {e}")
+            self.logger.debug("Could not check file %s: %s", file_path, e)
     
-    def _should_exclude_file(self, file_path: str) -> bool:
-        """Check if file should be excluded from monitoring."""
-        path_obj = Path(file_path)
+    def check_stat(self, file_path: str, stat_info: os.stat_result) -> None:
+        """Check a file from its stat result and report it if unsafe."""
+        # Most changed files (0644, 0600, ...) cannot be unsafe at all
+        if not self.scanner.may_be_unsafe(file_path, stat_info):
+            self._forget(file_path)
+            return
         
-        # Check exclude patterns
-        for pattern in self.scanner.config.get('exclude_patterns', []):
-            if pattern in str(path_obj):
-                return True
+        # Editors often write and then rename or touch a file; if nothing
+        # the checks look at has changed, there is nothing new to report
+        if not self._changed_since_last_check(file_path, stat_info):
+            return
         
-        # Check file size
-        try:
-            file_size = os.path.getsize(file_path)
-            if file_size > self.scanner.config.get('max_file_size', 100 * 1024 * 1024):
-                return True
-        except OSError:
-            pass
+        self._report(file_path, stat_info)
+    
+    def resync_stat(self, file_path: str, stat_info: os.stat_result, alert: bool = True) -> None:
+        """Check a file found by a resync and report it if unsafe and changed.
+        
+        Files are compared with their state at the previous resync or event
+        check. With alert False the state is only recorded, so the file is
+        reported later only if it changes.
+        """
+        if not self.scanner.may_be_unsafe(file_path, stat_info):
+            self._forget(file_path)
+            return
+        
+        state = _file_state(stat_info)
+        with self._results_lock:
+            if self._resync_seen.get(file_path) == state:
+                return
+            self._resync_seen[file_path] = state
+        
+        # The event check may already have reported this very state
+        if alert and self._changed_since_last_check(file_path, stat_info):
+            self._report(file_path, stat_info)
+    
+    def _forget(self, file_path: str) -> None:
+        """Drop the recorded state of a file that cannot be unsafe.
+        
+        chmod leaves mtime alone, so a stale unsafe state would hide the file
+        going back to it.
+        """
+        with self._results_lock:
+            self._last_seen.pop(file_path, None)
+            self._resync_seen.pop(file_path, None)
+    
+    def _report(self, file_path: str, stat_info: os.stat_result) -> None:
+        """Record, log and pass on a file if it is unsafe."""
+        # Classified with the scanner's issue flags, which also bumps the
+        # matching scan_stats counters under the scanner's lock
+        unsafe_file = self.scanner.scan_file(file_path, stat_info)
+        
+        if unsafe_file:
+            issues = unsafe_file.issues
+            risk_level = unsafe_file.risk_level
+            
+            # Several pool threads may get here
+            with self._results_lock:
+                self.findings.append(unsafe_file)
+            
+            # Log the finding; skipped outright when warnings are filtered
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning("REAL-TIME ALERT: Unsafe file detected - %s", file_path)
+                self.logger.warning("  Risk Level: %s", risk_level)
+                self.logger.warning("  Issues: %s", ", ".join(issues))
+            
+            # Call callback if provided
+            if self.callback:
+                self.callback(unsafe_file)
+    
+    def _changed_since_last_check(self, file_path: str, stat_info: os.stat_result) -> bool:
+        """Record a file's checked state and tell whether it differs from the last event check."""
+        state = _file_state(stat_info)
         
-        return False
+        with self._results_lock:
+            self._resync_seen[file_path] = state
+            if self._last_seen.get(file_path) == state:
+                self._last_seen.move_to_end(file_path)
+                return False
+            
+            self._last_seen[file_path] = state
+            self._last_seen.move_to_end(file_path)
+            if len(self._last_seen) > LAST_SEEN_SIZE:
+                self._last_seen.popitem(last=False)
+        return True
+    
+    def _should_exclude_file(self, file_path: str) -> bool:
+        """Check if file should be excluded from monitoring.
+        
+        Files over max_file_size are skipped by scan_file() from the stat
+        _check_file already makes, so only the path is looked at here.
+        """
+        return self._exclude_re is not None and self._exclude_re.search(file_path) is not None
 
 
 class RealTimeMonitor:
@@ -135,10 +296,16 @@ class RealTimeMonitor:
         self.scanner = scanner
         self.callback = callback
         self.observer = None
+        self.event_handler = None
         self.is_monitoring = False
         self.monitored_dirs = []
         self.logger = logging.getLogger(__name__)
         
+        # Background re-checks of the monitored trees
+        self._resync_thread = None
+        self._resync_stop = threading.Event()
+        self._started_ns: Optional[int] = None
+        
         if not WATCHDOG_AVAILABLE:
             raise ImportError("watchdog library is required for real-time monitoring. Install with: pip install watchdog")
     
@@ -150,30 +317,101 @@ class RealTimeMonitor:
         
         self.observer = Observer()
         event_handler = UnsafeFileEventHandler(self.scanner, self.callback)
+        self.event_handler = event_handler
         
-        for directory in directories:
-            if os.path.exists(directory) and os.path.isdir(directory):
-                self.observer.schedule(event_handler, directory, recursive=True)
-                self.monitored_dirs.append(directory)
-                self.logger.info(f"Started monitoring directory: {directory}")
-            else:
-                self.logger.warning(f"Directory does not exist or is not accessible: {directory}")
+        for directory in self._watch_roots(directories):
+            self._schedule(event_handler, directory)
+            self.monitored_dirs.append(directory)
         
         if self.monitored_dirs:
+            self._started_ns = time.time_ns()
             self.observer.start()
             self.is_monitoring = True
+            
+            self._resync_stop.clear()
+            self._resync_thread = threading.Thread(target=self._resync_loop, daemon=True)
+            self._resync_thread.start()
             self.logger.info(f"Real-time monitoring started for {len(self.monitored_dirs)} directories")
         else:
             self.logger.error("No valid directories to monitor")
     
+    def _watch_roots(self, directories: List[str]) -> List[str]:
+        """Return the existing directories to watch, leaving out ones inside another.
+        
+        Watches are recursive, so a directory below another one would only
+        add duplicate watches and have its events (and resyncs) handled twice.
+        """
+        roots: List[str] = []
+        
+        # Sorting by components puts each directory right after its parent
+        for directory in sorted(map(os.path.abspath, directories), key=lambda d: d.split(os.sep)):
+            if not os.path.isdir(directory):
+                self.logger.warning("Directory does not exist or is not accessible: %s", directory)
+                continue
+            if roots and (directory + os.sep).startswith(roots[-1].rstrip(os.sep) + os.sep):
+                continue
+            roots.append(directory)
+        
+        return roots
+    
+    def _schedule(self, event_handler, directory: str) -> None:
+        """Watch a directory tree for the events the handler acts on."""
+        try:
+            self.observer.schedule(event_handler, directory, recursive=True,
+                                   event_filter=HANDLED_EVENTS)
+        except TypeError:
+            # watchdog < 4.0 has no event_filter; the handler ignores the rest
+            self.observer.schedule(event_handler, directory, recursive=True)
+    
     def stop_monitoring(self) -> None:
         """Stop monitoring."""
         if self.observer and self.is_monitoring:
+            self._resync_stop.set()
+            self._resync_thread.join()
             self.observer.stop()
             self.observer.join()
+            self.event_handler.close()
             self.is_monitoring = False
             self.logger.info("Real-time monitoring stopped")
     
+    def resync(self, alert: bool = True) -> None:
+        """Re-check every monitored file to catch changes whose events were lost.
+        
+        The trees are walked like a scan, with each file stat'ed once through
+        its DirEntry. With alert False files are only recorded, giving the
+        baseline later resyncs compare against; files changed since
+        monitoring started are left to their events.
+        """
+        handler = self.event_handler
+        
+        recent_ns = None
+        if not alert and self._started_ns is not None:
+            recent_ns = self._started_ns - BASELINE_MARGIN_NS
+        
+        for directory in self.monitored_dirs:
+            for file_path, stat_info in self.scanner.iter_files(directory, self._resync_stop):
+                if self._resync_stop.is_set():
+                    return
+                if handler._should_exclude_file(file_path):
+                    continue
+                if recent_ns is not None and stat_info.st_ctime_ns >= recent_ns:
+                    continue
+                try:
+                    handler.resync_stat(file_path, stat_info, alert)
+                except OSError as e:
+                    self.logger.debug("Could not check file %s: %s", file_path, e)
+    
+    def _resync_loop(self) -> None:
+        """Record the monitored trees, then resync every resync_interval seconds."""
+        self.resync(alert=False)
+        
+        interval = self.scanner.config.get('resync_interval', 300)
+        if interval <= 0:
+            return
+        
+        while not self._resync_stop.wait(interval):
+            self.resync()
+    
     def get_status(self) -> Dict:
         """Get monitoring status."""
         return {
@@ -184,38 +422,111 @@ class RealTimeMonitor:
 
 
 class RealTimeMonitorGUI:
-    """GUI wrapper for real-time monitoring."""
+    """GUI wrapper for real-time monitoring.
+    
+    With a Tk root, alerts found on the monitor's threads are queued and
+    gui_callback is called on the Tk thread, every GUI_POLL_MS, with a list
+    of the files found since the last call. Without one, gui_callback is
+    called for each file on the monitor's threads.
+    """
     
-    def __init__(self, scanner, gui_callback: Optional[Callable] = None):
+    def __init__(self, scanner, gui_callback: Optional[Callable] = None, root=None):
         self.scanner = scanner
         self.gui_callback = gui_callback
+        self.root = root
         self.monitor = None
         self.monitor_thread = None
         self.logger = logging.getLogger(__name__)
+        
+        # A stop requested while monitor_thread is still starting the monitor
+        # is carried out by that thread once the start completes
+        self._state_lock = threading.Lock()
+        self._starting = False
+        self._stop_requested = False
+        
+        self._alerts: queue.Queue = queue.Queue(maxsize=GUI_QUEUE_SIZE)
+        self._poll_job = None
     
     def start_monitoring(self, directories: List[str]) -> None:
-        """Start monitoring in a separate thread."""
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.logger.warning("Monitoring thread is already running")
-            return
+        """Start monitoring in a separate thread.
+        
+        Starting the observer adds a watch for every directory in the trees
+        (inotify on Linux), which takes a while on large trees and must not
+        block the GUI.
+        """
+        with self._state_lock:
+            if self._starting or (self.monitor and self.monitor.is_monitoring):
+                self.logger.warning("Monitoring is already active")
+                return
+            self._starting = True
+            self._stop_requested = False
         
         def monitor_callback(unsafe_file):
             """Callback for when unsafe files are detected."""
-            if self.gui_callback:
-                self.gui_callback(unsafe_file)
+            if self.root is None:
+                if self.gui_callback:
+                    self.gui_callback(unsafe_file)
+                return
+            
+            try:
+                self._alerts.put_nowait(unsafe_file)
+            except queue.Full:
+                # The alert is still logged and kept in the handler's findings
+                self.logger.debug("GUI alert queue full, not showing %s", unsafe_file.path)
+        
+        if self.root is not None and self._poll_job is None:
+            self._poll_job = self.root.after(GUI_POLL_MS, self._poll_alerts)
         
         self.monitor = RealTimeMonitor(self.scanner, monitor_callback)
         self.monitor_thread = threading.Thread(
-            target=self.monitor.start_monitoring,
+            target=self._run_monitor,
             args=(directories,),
             daemon=True
         )
         self.monitor_thread.start()
     
+    def _run_monitor(self, directories: List[str]) -> None:
+        """Start the monitor, then stop it again if a stop came in meanwhile."""
+        try:
+            self.monitor.start_monitoring(directories)
+        finally:
+            with self._state_lock:
+                self._starting = False
+                stop = self._stop_requested
+        
+        if stop:
+            self.monitor.stop_monitoring()
+    
     def stop_monitoring(self) -> None:
         """Stop monitoring."""
-        if self.monitor:
+        with self._state_lock:
+            self._stop_requested = True
+            starting = self._starting
+        
+        if self.monitor and not starting:
             self.monitor.stop_monitoring()
+        
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+            self._deliver_alerts()
+    
+    def _poll_alerts(self) -> None:
+        """Deliver queued alerts and poll again; runs on the Tk thread."""
+        self._deliver_alerts()
+        self._poll_job = self.root.after(GUI_POLL_MS, self._poll_alerts)
+    
+    def _deliver_alerts(self) -> None:
+        """Pass every queued alert to gui_callback as one batch."""
+        batch = []
+        try:
+            while True:
+                batch.append(self._alerts.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch and self.gui_callback:
+            self.gui_callback(batch)
     
     def get_status(self) -> Dict:
         """Get monitoring status."""
@@ -14,13 +14,22 @@ import sys
 import stat
 import argparse
 import logging
+import logging.handlers
+import re
 import json
 import time
 import csv
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Tuple, Optional, Iterator, Pattern, BinaryIO, Callable
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntFlag
+from types import GeneratorType
+from functools import lru_cache, partial
 
 # Import rule engine
 try:
@@ -31,6 +40,14 @@ except ImportError:
     RuleEngine = None
     RuleMatch = None
 
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Platform-specific imports
 try:
     import pwd
@@ -43,9 +60,318 @@ except ImportError:
     UNIX_PLATFORM = False
 
 
+class Issue(IntFlag):
+    """Permission issues detected by the scanner, as combinable bit flags."""
+    SUID = 1
+    SGID = 2
+    WORLD_WRITABLE = 4
+    GROUP_WRITABLE_NOT_OWNER = 8
+    OTHERS_WRITABLE_NOT_OWNER = 16
+    EXECUTABLE_NOT_READABLE = 32
+    DIRECTORY_NOT_READABLE = 64
+    DIRECTORY_NOT_EXECUTABLE = 128
+    WINDOWS_WORLD_WRITABLE = 256
+    WINDOWS_EXECUTABLE_NOT_READABLE = 512
+
+
+# Human-readable issue text, in the order issues are reported
+ISSUE_MESSAGES = {
+    Issue.SUID: "SUID bit set",
+    Issue.SGID: "SGID bit set",
+    Issue.WORLD_WRITABLE: "World-writable",
+    Issue.GROUP_WRITABLE_NOT_OWNER: "Group-writable but not owner-writable",
+    Issue.OTHERS_WRITABLE_NOT_OWNER: "Others-writable but not owner-writable",
+    Issue.EXECUTABLE_NOT_READABLE: "Executable but not readable by owner",
+    Issue.DIRECTORY_NOT_READABLE: "Directory not readable by owner",
+    Issue.DIRECTORY_NOT_EXECUTABLE: "Directory not executable by owner",
+    Issue.WINDOWS_WORLD_WRITABLE: "Potentially world-writable (Windows)",
+    Issue.WINDOWS_EXECUTABLE_NOT_READABLE: "Executable but not readable (Windows)",
+}
+
+# Issues that make a file writable by someone other than its owner
+WRITABLE_ISSUES = (
+    Issue.WORLD_WRITABLE
+    | Issue.GROUP_WRITABLE_NOT_OWNER
+    | Issue.OTHERS_WRITABLE_NOT_OWNER
+    | Issue.WINDOWS_WORLD_WRITABLE
+)
+
+
+# Listing a directory by fd makes DirEntry.stat() use fstatat() (POSIX only)
+SCANDIR_FD_SUPPORTED = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+
+# Plain int copies of the Issue flags for the per-file classifier
+_SUID = Issue.SUID.value
+_SGID = Issue.SGID.value
+_WORLD_WRITABLE = Issue.WORLD_WRITABLE.value
+_GROUP_WRITABLE_NOT_OWNER = Issue.GROUP_WRITABLE_NOT_OWNER.value
+_OTHERS_WRITABLE_NOT_OWNER = Issue.OTHERS_WRITABLE_NOT_OWNER.value
+_EXECUTABLE_NOT_READABLE = Issue.EXECUTABLE_NOT_READABLE.value
+_DIRECTORY_NOT_READABLE = Issue.DIRECTORY_NOT_READABLE.value
+_DIRECTORY_NOT_EXECUTABLE = Issue.DIRECTORY_NOT_EXECUTABLE.value
+
+# Mode bits that can make a regular file unsafe: SUID, SGID, group/other write
+_UNSAFE_MODE_BITS = stat.S_ISUID | stat.S_ISGID | stat.S_IWGRP | stat.S_IWOTH
+_OWNER_READ_EXEC = stat.S_IRUSR | stat.S_IXUSR
+
+
+def _classify(mode: int) -> int:
+    """Return the Issue flags for a Unix st_mode in a single pass."""
+    is_dir = stat.S_ISDIR(mode)
+    owner_read_exec = mode & _OWNER_READ_EXEC
+    
+    # Fast path: most files have none of the bits that can make them unsafe
+    if not (mode & _UNSAFE_MODE_BITS or is_dir or owner_read_exec == stat.S_IXUSR):
+        return 0
+    
+    flags = 0
+    owner_writable = mode & stat.S_IWUSR
+    
+    if mode & stat.S_ISUID:
+        flags |= _SUID
+    if mode & stat.S_ISGID:
+        flags |= _SGID
+    if mode & stat.S_IWOTH:
+        flags |= _WORLD_WRITABLE
+        if not owner_writable:
+            flags |= _OTHERS_WRITABLE_NOT_OWNER
+    if mode & stat.S_IWGRP and not owner_writable:
+        flags |= _GROUP_WRITABLE_NOT_OWNER
+    
+    # Executable but not readable by owner
+    if owner_read_exec == stat.S_IXUSR:
+        flags |= _EXECUTABLE_NOT_READABLE
+    
+    # Directories the owner cannot list or enter
+    if is_dir:
+        if not mode & stat.S_IRUSR:
+            flags |= _DIRECTORY_NOT_READABLE
+        if not mode & stat.S_IXUSR:
+            flags |= _DIRECTORY_NOT_EXECUTABLE
+    
+    return flags
+
+
+def describe_issues(flags: int) -> List[str]:
+    """Convert a combination of Issue flags to their report messages."""
+    if not flags:
+        return []
+    return list(_issue_messages(int(flags)))
+
+
+@lru_cache(maxsize=None)
+def _issue_messages(flags: int) -> Tuple[str, ...]:
+    """Messages for one flag combination; only a few combinations occur."""
+    return tuple(message for issue, message in ISSUE_MESSAGES.items() if flags & issue)
+
+
+@lru_cache(maxsize=None)
+def _filemode(mode: int) -> str:
+    """Return the permission string for a mode, shared between records.
+    
+    Only a few hundred distinct modes occur, so records with the same
+    permissions reference one string instead of carrying their own copy.
+    """
+    return stat.filemode(mode)
+
+
+@lru_cache(maxsize=4096)
+def _uid_name(uid: int) -> str:
+    """Resolve a uid to a user name, caching results across files."""
+    if not (UNIX_PLATFORM and pwd):
+        return str(uid)
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=4096)
+def _gid_name(gid: int) -> str:
+    """Resolve a gid to a group name, caching results across files."""
+    if not (UNIX_PLATFORM and grp):
+        return str(gid)
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def _split_path(path: str) -> List[str]:
+    """Split a path into its components without building a Path object."""
+    if os.altsep:
+        path = path.replace(os.altsep, os.sep)
+    return path.split(os.sep)
+
+
+@lru_cache(maxsize=4096)
+def _format_mtime(mtime: float) -> str:
+    """Format a modification time for reports.
+    
+    Files unpacked from the same package or archive usually share an
+    identical mtime, so the formatted strings are cached.
+    """
+    return datetime.fromtimestamp(mtime).isoformat()
+
+
+# Report extensions written as one JSON object per line
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def _encode_json_line(record: Dict) -> bytes:
+    """Encode a record as a single line of JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record).encode('utf-8') + b"\n"
+
+
+def _encode_json(value) -> bytes:
+    """Encode a value as JSON indented by two spaces."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+
+def _encode_json_member(key: str, value) -> bytes:
+    """Encode a top-level report entry, indented for a two-space layout."""
+    return _encode_json(key) + b": " + _encode_json(value).replace(b"\n", b"\n  ")
+
+
+def _encode_json_record(record: Dict) -> bytes:
+    """Encode an entry of the report's unsafe_files array."""
+    return _encode_json(record).replace(b"\n", b"\n    ")
+
+
+# HTML report templates, compiled lazily by _get_html_template()
+_HTML_REPORT = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Unsafe File Scanner Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .header { text-align: center; color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 20px; margin-bottom: 30px; }
+        .summary { background: #ecf0f1; padding: 20px; border-radius: 5px; margin-bottom: 30px; }
+        .summary h2 { color: #2c3e50; margin-top: 0; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
+        .stat-card { background: white; padding: 15px; border-radius: 5px; text-align: center; border-left: 4px solid #3498db; }
+        .stat-number { font-size: 2em; font-weight: bold; color: #2c3e50; }
+        .stat-label { color: #7f8c8d; margin-top: 5px; }
+        .results { margin-top: 30px; }
+        .results h2 { color: #2c3e50; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #3498db; color: white; font-weight: bold; }
+        tr:nth-child(even) { background-color: #f2f2f2; }
+        .risk-high { color: #e74c3c; font-weight: bold; }
+        .risk-medium { color: #f39c12; font-weight: bold; }
+        .risk-low { color: #27ae60; font-weight: bold; }
+        .issues { max-width: 300px; word-wrap: break-word; }
+        .footer { text-align: center; margin-top: 40px; color: #7f8c8d; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔒 Unsafe File Scanner Report</h1>
+            <p>Generated on $generated_at</p>
+        </div>
+        
+        <div class="summary">
+            <h2>📊 Scan Summary</h2>
+            <div class="stats">
+                <div class="stat-card">
+                    <div class="stat-number">$total_files</div>
+                    <div class="stat-label">Total Files Scanned</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">$total_unsafe_files</div>
+                    <div class="stat-label">Unsafe Files Found</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">$high_risk_files</div>
+                    <div class="stat-label">High Risk</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">$medium_risk_files</div>
+                    <div class="stat-label">Medium Risk</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">$low_risk_files</div>
+                    <div class="stat-label">Low Risk</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">${scan_duration}s</div>
+                    <div class="stat-label">Scan Duration</div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="results">
+            <h2>🔍 Detailed Results</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>File Path</th>
+                        <th>Permissions</th>
+                        <th>Owner</th>
+                        <th>Group</th>
+                        <th>Size</th>
+                        <th>Risk Level</th>
+                        <th>Issues</th>
+                    </tr>
+                </thead>
+                <tbody>
+$rows
+                </tbody>
+            </table>
+        </div>
+        
+        <div class="footer">
+            <p>Generated by Unsafe File Scanner - A Linux Security Tool</p>
+            <p>For more information, visit the project documentation</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_HTML_ROW = """
+                    <tr>
+                        <td><code>$path</code></td>
+                        <td><code>$permissions</code></td>
+                        <td>$owner</td>
+                        <td>$group</td>
+                        <td>$size bytes</td>
+                        <td class="$risk_class">$risk_level</td>
+                        <td class="issues">$issues</td>
+                    </tr>
+"""
+
+_HTML_TEMPLATE = None
+_HTML_ROW_TEMPLATE = None
+
+
+def _get_html_template() -> Tuple[string.Template, string.Template]:
+    """Return the compiled HTML page and row templates, building them once."""
+    global _HTML_TEMPLATE, _HTML_ROW_TEMPLATE
+    if _HTML_TEMPLATE is None:
+        _HTML_TEMPLATE = string.Template(_HTML_REPORT)
+        _HTML_ROW_TEMPLATE = string.Template(_HTML_ROW)
+    return _HTML_TEMPLATE, _HTML_ROW_TEMPLATE
+
+
 @dataclass
 class UnsafeFile:
     """Represents an unsafe file with its security issues."""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('path', 'permissions', 'owner', 'group', 'size',
+                 'modified_time', 'issues', 'risk_level')
+    
     path: str
     permissions: str
     owner: str
@@ -54,16 +380,50 @@ class UnsafeFile:
     modified_time: str
     issues: List[str]
     risk_level: str
+    
+    def to_dict(self) -> Dict:
+        """Return the record as a plain dict for reports.
+        
+        Equivalent to dataclasses.asdict() for this flat record, without
+        its recursive deep copy.
+        """
+        return {
+            'path': self.path,
+            'permissions': self.permissions,
+            'owner': self.owner,
+            'group': self.group,
+            'size': self.size,
+            'modified_time': self.modified_time,
+            'issues': list(self.issues),
+            'risk_level': self.risk_level
+        }
 
 
 class UnsafeFileScanner:
     """Main scanner class for detecting unsafe file permissions."""
     
-    def __init__(self, config_file: Optional[str] = None):
-        """Initialize the scanner with optional configuration."""
-        self.config = self._load_config(config_file)
+    def __init__(self, config_file: Optional[str] = None, overrides: Optional[Dict] = None):
+        """Initialize the scanner with optional configuration.
+        
+        overrides, such as command line options, take precedence over the
+        config file and are applied before logging and exclusions are set up.
+        """
+        self.config = self._load_config(config_file, overrides)
         self.setup_logging()
+        
+        # Precompile risk indicator keywords used by assess_risk_level()
+        self._high_risk_re = self._compile_risk_indicators('high')
+        self._medium_risk_re = self._compile_risk_indicators('medium')
+        self._flag_risk_levels: Dict[int, str] = {}
         self.unsafe_files: List[UnsafeFile] = []
+        self._stats_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        
+        # Set while run_scan streams records to a JSON or NDJSON report
+        self._report_stream: Optional[BinaryIO] = None
+        self._stream_json = False
+        self._stream_has_records = False
+        self._streamed_risk_counts: Counter = Counter()
         self.scan_stats = {
             'total_files': 0,
             'unsafe_files': 0,
@@ -83,13 +443,19 @@ class UnsafeFileScanner:
         else:
             self.logger.warning("Rule engine not available - install rule_engine.py")
     
-    def _load_config(self, config_file: Optional[str]) -> Dict:
+    def _load_config(self, config_file: Optional[str], overrides: Optional[Dict] = None) -> Dict:
         """Load configuration from file or use defaults."""
         default_config = {
             'exclude_dirs': ['.git', '.svn', 'node_modules', '__pycache__', '.pytest_cache'],
             'exclude_files': ['.DS_Store', 'Thumbs.db'],
             'max_file_size': 100 * 1024 * 1024,  # 100MB
             'follow_symlinks': False,
+            'scan_threads': 1,
+            'stream_output': False,
+            'io_batch': 32,
+            'debounce_ms': 100,
+            'realtime_history': 10000,
+            'resync_interval': 300,
             'log_level': 'INFO',
             'output_format': 'json',
             'output_file': None,
@@ -100,68 +466,76 @@ class UnsafeFileScanner:
             }
         }
         
-        if config_file and os.path.exists(config_file):
+        if config_file:
             try:
                 with open(config_file, 'r') as f:
                     user_config = json.load(f)
                     default_config.update(user_config)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Warning: Could not load config file {config_file}: {e}")
                 print("Using default configuration.")
         
+        if overrides:
+            default_config.update(overrides)
+        
+        # Exclusions are checked for every entry, so make them hash lookups
+        default_config['exclude_dirs'] = frozenset(default_config['exclude_dirs'])
+        default_config['exclude_files'] = frozenset(default_config['exclude_files'])
+        
         return default_config
     
     def setup_logging(self):
         """Setup logging configuration."""
         log_level = getattr(logging, self.config['log_level'].upper(), logging.INFO)
+        
+        # Batch log file writes of INFO/DEBUG chatter; warnings (which include
+        # every finding and real-time alert), errors and shutdown flush the buffer
+        file_handler = logging.FileHandler('unsafe_file_scanner.log')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        buffered_handler = logging.handlers.MemoryHandler(
+            1024, flushLevel=logging.WARNING, target=file_handler
+        )
+        
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.StreamHandler(sys.stdout),
-                logging.FileHandler('unsafe_file_scanner.log')
+                buffered_handler
             ]
         )
         self.logger = logging.getLogger(__name__)
+        
+        # Checked before per-file debug messages so they cost nothing when off
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
     
     def is_excluded(self, path: str) -> bool:
         """Check if a path should be excluded from scanning."""
-        path_obj = Path(path)
-        
         # Check if any parent directory is in exclude list
-        for part in path_obj.parts:
-            if part in self.config['exclude_dirs']:
-                return True
-        
-        # Check if file itself should be excluded
-        if path_obj.name in self.config['exclude_files']:
+        if self._is_excluded_root(path):
             return True
         
-        return False
+        # Check if file itself should be excluded
+        return os.path.basename(path) in self.config['exclude_files']
     
-    def get_file_permissions(self, file_path: str) -> Tuple[str, str, str, str]:
-        """Get file permissions, owner, and group information."""
+    def get_file_permissions(self, file_path: str,
+                             stat_info: Optional[os.stat_result] = None) -> Tuple[str, str, str, str]:
+        """Get file permissions, owner, and group information.
+        
+        The file is only stat'ed when no stat_info is supplied.
+        """
         try:
-            stat_info = os.stat(file_path, follow_symlinks=self.config['follow_symlinks'])
+            if stat_info is None:
+                stat_info = os.stat(file_path, follow_symlinks=self.config['follow_symlinks'])
             
             # Get permission string (e.g., 'rwxr-xr-x')
-            permissions = stat.filemode(stat_info.st_mode)
+            permissions = _filemode(stat_info.st_mode)
             
-            # Get owner and group names
-            if UNIX_PLATFORM and pwd and grp:
-                try:
-                    owner = pwd.getpwuid(stat_info.st_uid).pw_name
-                except KeyError:
-                    owner = str(stat_info.st_uid)
-                
-                try:
-                    group = grp.getgrgid(stat_info.st_gid).gr_name
-                except KeyError:
-                    group = str(stat_info.st_gid)
-            else:
-                # Windows or other non-Unix platform
-                owner = str(stat_info.st_uid)
-                group = str(stat_info.st_gid)
+            # Get owner and group names (numeric ids on non-Unix platforms)
+            owner = _uid_name(stat_info.st_uid)
+            group = _gid_name(stat_info.st_gid)
             
             # Get file size
             size = stat_info.st_size
@@ -169,142 +543,152 @@ class UnsafeFileScanner:
             return permissions, owner, group, size
             
         except (OSError, PermissionError) as e:
-            self.logger.warning(f"Could not access {file_path}: {e}")
+            self.logger.warning("Could not access %s: %s", file_path, e)
             return "unknown", "unknown", "unknown", 0
     
     def check_suid_sgid(self, file_path: str, stat_info: os.stat_result) -> List[str]:
         """Check for SUID and SGID bits."""
-        issues = []
-        
-        # SUID/SGID are Unix concepts, skip on Windows
-        if not UNIX_PLATFORM:
-            return issues
-            
-        mode = stat_info.st_mode
-        
-        if mode & stat.S_ISUID:
-            issues.append("SUID bit set")
-        
-        if mode & stat.S_ISGID:
-            issues.append("SGID bit set")
-        
-        return issues
+        flags = self._issue_flags(file_path, stat_info)
+        return describe_issues(flags & (Issue.SUID | Issue.SGID))
     
     def check_world_writable(self, file_path: str, stat_info: os.stat_result) -> List[str]:
         """Check if file is world-writable."""
-        issues = []
-        
-        # World-writable is a Unix concept, adapt for Windows
-        if not UNIX_PLATFORM:
-            # On Windows, check if file is writable by everyone
-            # This is a simplified check - Windows permissions are more complex
-            try:
-                # Try to open file for writing
-                with open(file_path, 'a'):
-                    pass
-                # If we can write, check if it's in a public location
-                if any(public in file_path.lower() for public in ['public', 'shared', 'temp', 'tmp']):
-                    issues.append("Potentially world-writable (Windows)")
-            except (OSError, PermissionError):
-                pass
-            return issues
-            
-        mode = stat_info.st_mode
-        
-        if mode & stat.S_IWOTH:  # World write permission
-            issues.append("World-writable")
-        
-        return issues
+        flags = self._issue_flags(file_path, stat_info)
+        return describe_issues(flags & (Issue.WORLD_WRITABLE | Issue.WINDOWS_WORLD_WRITABLE))
     
     def check_non_owner_writable(self, file_path: str, stat_info: os.stat_result) -> List[str]:
         """Check if file is writable by non-owners."""
-        issues = []
-        
-        # Non-owner writable is a Unix concept, adapt for Windows
-        if not UNIX_PLATFORM:
-            # On Windows, this is more complex due to ACLs
-            # For now, we'll skip this check on Windows
-            return issues
-            
-        mode = stat_info.st_mode
-        
-        # Check if group has write permission but owner doesn't
-        if mode & stat.S_IWGRP and not (mode & stat.S_IWUSR):
-            issues.append("Group-writable but not owner-writable")
-        
-        # Check if others have write permission but owner doesn't
-        if mode & stat.S_IWOTH and not (mode & stat.S_IWUSR):
-            issues.append("Others-writable but not owner-writable")
-        
-        return issues
+        flags = self._issue_flags(file_path, stat_info)
+        return describe_issues(flags & (Issue.GROUP_WRITABLE_NOT_OWNER | Issue.OTHERS_WRITABLE_NOT_OWNER))
     
     def check_other_permissions(self, file_path: str, stat_info: os.stat_result) -> List[str]:
         """Check for other permission-related issues."""
-        issues = []
+        flags = self._issue_flags(file_path, stat_info)
+        return describe_issues(flags & (
+            Issue.EXECUTABLE_NOT_READABLE
+            | Issue.DIRECTORY_NOT_READABLE
+            | Issue.DIRECTORY_NOT_EXECUTABLE
+            | Issue.WINDOWS_EXECUTABLE_NOT_READABLE
+        ))
+    
+    def _issue_flags(self, file_path: str, stat_info: os.stat_result) -> int:
+        """Return all Issue flags for a file."""
+        if UNIX_PLATFORM:
+            return _classify(stat_info.st_mode)
+        return self._windows_issue_flags(file_path)
+    
+    def may_be_unsafe(self, file_path: str, stat_info: os.stat_result) -> bool:
+        """Quick pre-check: False when scan_file() would certainly report nothing.
         
-        # Permission checks are Unix-specific, adapt for Windows
-        if not UNIX_PLATFORM:
-            # On Windows, check for some basic issues
-            try:
-                # Check if file is executable but not readable
-                if file_path.endswith(('.exe', '.bat', '.cmd', '.com')):
-                    try:
-                        with open(file_path, 'r'):
-                            pass
-                    except (OSError, PermissionError):
-                        issues.append("Executable but not readable (Windows)")
-            except:
-                pass
-            return issues
-            
-        mode = stat_info.st_mode
+        On Unix this is a few bit tests on st_mode; callers such as the
+        real-time monitor use it to drop most events before doing any
+        bookkeeping.
+        """
+        return self.rule_engine is not None or bool(self._issue_flags(file_path, stat_info))
+    
+    def _windows_issue_flags(self, file_path: str) -> int:
+        """Return Issue flags for a file on Windows.
+        
+        Unix permission bits are meaningless here, so these are simplified
+        path and access based checks - Windows permissions are more complex.
+        """
+        flags = 0
         
-        # Check for files with execute permission but no read permission
-        if mode & stat.S_IXUSR and not (mode & stat.S_IRUSR):
-            issues.append("Executable but not readable by owner")
+        # Check if file is writable by everyone
+        try:
+            # Try to open file for writing
+            with open(file_path, 'a'):
+                pass
+            # If we can write, check if it's in a public location
+            if any(public in file_path.lower() for public in ['public', 'shared', 'temp', 'tmp']):
+                flags |= Issue.WINDOWS_WORLD_WRITABLE
+        except (OSError, PermissionError):
+            pass
         
-        # Check for directories with unusual permissions
-        if stat.S_ISDIR(mode):
-            if not (mode & stat.S_IRUSR):
-                issues.append("Directory not readable by owner")
-            if not (mode & stat.S_IXUSR):
-                issues.append("Directory not executable by owner")
+        # Check if file is executable but not readable
+        if file_path.endswith(('.exe', '.bat', '.cmd', '.com')):
+            try:
+                with open(file_path, 'r'):
+                    pass
+            except (OSError, PermissionError):
+                flags |= Issue.WINDOWS_EXECUTABLE_NOT_READABLE
         
-        return issues
+        return flags
+    
+    def _compile_risk_indicators(self, level: str) -> Optional[Pattern[str]]:
+        """Compile the indicator keywords of a risk level into one regex."""
+        indicators = self.config['risk_thresholds'].get(level)
+        if not isinstance(indicators, (list, tuple)) or not indicators:
+            return None
+        return re.compile('|'.join(re.escape(str(indicator)) for indicator in indicators))
     
     def assess_risk_level(self, issues: List[str]) -> str:
         """Assess the risk level based on detected issues."""
-        high_risk_indicators = self.config['risk_thresholds']['high']
-        medium_risk_indicators = self.config['risk_thresholds']['medium']
+        joined_issues = '\n'.join(issues).lower()
         
-        for issue in issues:
-            if any(indicator in issue.lower() for indicator in high_risk_indicators):
-                return "HIGH"
-            if any(indicator in issue.lower() for indicator in medium_risk_indicators):
-                return "MEDIUM"
+        if self._high_risk_re and self._high_risk_re.search(joined_issues):
+            return "HIGH"
+        if self._medium_risk_re and self._medium_risk_re.search(joined_issues):
+            return "MEDIUM"
         
         return "LOW"
     
-    def scan_file(self, file_path: str) -> Optional[UnsafeFile]:
-        """Scan a single file for unsafe permissions."""
-        try:
+    def _flag_risk_level(self, issue_flags: int) -> str:
+        """Risk level for a combination of permission issues.
+        
+        The keyword match only depends on the issue messages, so it is run
+        once per flag combination and remembered.
+        """
+        risk_level = self._flag_risk_levels.get(issue_flags)
+        if risk_level is None:
+            risk_level = self.assess_risk_level(describe_issues(issue_flags))
+            self._flag_risk_levels[int(issue_flags)] = risk_level
+        return risk_level
+    
+    def scan_file(self, file_path: str, stat_info: Optional[os.stat_result] = None) -> Optional[UnsafeFile]:
+        """Scan a single file for unsafe permissions.
+        
+        If stat_info is given (e.g. from a DirEntry during a directory walk)
+        it is used as-is and the file is not stat'ed again.
+        """
+        if stat_info is None:
             if self.is_excluded(file_path):
                 return None
-            
-            # Check file size limit
-            if os.path.getsize(file_path) > self.config['max_file_size']:
-                self.logger.debug(f"Skipping large file: {file_path}")
+            try:
+                stat_info = os.stat(file_path, follow_symlinks=self.config['follow_symlinks'])
+            except (OSError, PermissionError) as e:
+                self.logger.warning("Error scanning %s: %s", file_path, e)
+                return None
+        
+        return self._scan_stat_result(file_path, stat_info, self.config['max_file_size'])
+    
+    def _file_scanner(self) -> Callable[[str, os.stat_result], Optional[UnsafeFile]]:
+        """Return a per-file scan function with the configuration bound in.
+        
+        Directory walks call this once up front, so the config lookups are
+        not repeated for every file.
+        """
+        return partial(self._scan_stat_result, max_file_size=self.config['max_file_size'])
+    
+    def _scan_stat_result(self, file_path: str, stat_info: os.stat_result,
+                          max_file_size: int) -> Optional[UnsafeFile]:
+        """Check an already stat'ed file and build its UnsafeFile record."""
+        try:
+            # Check file size limit (st_size means nothing for other file types)
+            if stat_info.st_size > max_file_size and stat.S_ISREG(stat_info.st_mode):
+                if self._debug:
+                    self.logger.debug("Skipping large file: %s", file_path)
                 return None
-            
-            stat_info = os.stat(file_path, follow_symlinks=self.config['follow_symlinks'])
-            permissions, owner, group, size = self.get_file_permissions(file_path)
             
             # Check for various permission issues
-            all_issues = []
-            all_issues.extend(self.check_suid_sgid(file_path, stat_info))
-            all_issues.extend(self.check_world_writable(file_path, stat_info))
-            all_issues.extend(self.check_non_owner_writable(file_path, stat_info))
-            all_issues.extend(self.check_other_permissions(file_path, stat_info))
+            issue_flags = self._issue_flags(file_path, stat_info)
+            
+            # Benign files need no further work unless rules may still match
+            if not issue_flags and not self.rule_engine:
+                return None
+            
+            permissions, owner, group, size = self.get_file_permissions(file_path, stat_info)
+            all_issues = describe_issues(issue_flags)
             
             # Apply rule engine if available
             rule_matches = []
@@ -327,7 +711,10 @@ class UnsafeFileScanner:
                 return None
             
             # Create unsafe file record
-            risk_level = self.assess_risk_level(all_issues)
+            if rule_matches:
+                risk_level = self.assess_risk_level(all_issues)
+            else:
+                risk_level = self._flag_risk_level(issue_flags)
             
             # If rule engine found higher risk, use that
             if rule_matches:
@@ -339,7 +726,7 @@ class UnsafeFileScanner:
                 elif 'MEDIUM' in rule_risk_levels and risk_level not in ['CRITICAL', 'HIGH']:
                     risk_level = 'MEDIUM'
             
-            modified_time = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
+            modified_time = _format_mtime(stat_info.st_mtime)
             
             unsafe_file = UnsafeFile(
                 path=file_path,
@@ -353,47 +740,302 @@ class UnsafeFileScanner:
             )
             
             # Update statistics
-            self.scan_stats['unsafe_files'] += 1
-            if "SUID" in all_issues:
-                self.scan_stats['suid_files'] += 1
-            if "SGID" in all_issues:
-                self.scan_stats['sgid_files'] += 1
-            if "World-writable" in all_issues:
-                self.scan_stats['world_writable'] += 1
-            if any("writable" in issue for issue in all_issues):
-                self.scan_stats['non_owner_writable'] += 1
+            with self._stats_lock:
+                self.scan_stats['unsafe_files'] += 1
+                self.scan_stats['suid_files'] += bool(issue_flags & Issue.SUID)
+                self.scan_stats['sgid_files'] += bool(issue_flags & Issue.SGID)
+                self.scan_stats['world_writable'] += bool(issue_flags & Issue.WORLD_WRITABLE)
+                self.scan_stats['non_owner_writable'] += bool(issue_flags & WRITABLE_ISSUES)
             
             return unsafe_file
             
         except (OSError, PermissionError) as e:
-            self.logger.warning(f"Error scanning {file_path}: {e}")
+            self.logger.warning("Error scanning %s: %s", file_path, e)
             return None
     
     def scan_directory(self, directory: str) -> None:
         """Recursively scan a directory for unsafe files."""
         self.logger.info(f"Scanning directory: {directory}")
         
+        scan_file = self._file_scanner()
+        
         try:
-            for root, dirs, files in os.walk(directory, followlinks=self.config['follow_symlinks']):
-                # Remove excluded directories from dirs list to prevent walking into them
-                dirs[:] = [d for d in dirs if not self.is_excluded(os.path.join(root, d))]
+            for file_path, stat_info in self._scan_walk(directory):
+                self.scan_stats['total_files'] += 1
                 
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    self.scan_stats['total_files'] += 1
-                    
-                    unsafe_file = self.scan_file(file_path)
-                    if unsafe_file:
-                        self.unsafe_files.append(unsafe_file)
-                        self.logger.debug(f"Found unsafe file: {file_path} - {unsafe_file.issues}")
+                unsafe_file = scan_file(file_path, stat_info)
+                if unsafe_file:
+                    self._add_unsafe_file(unsafe_file)
+                    if self._debug:
+                        self.logger.debug("Found unsafe file: %s - %s", file_path, unsafe_file.issues)
         
         except PermissionError as e:
             self.logger.error(f"Permission denied accessing {directory}: {e}")
         except Exception as e:
             self.logger.error(f"Error scanning {directory}: {e}")
     
-    def generate_report(self) -> Dict:
-        """Generate a comprehensive scan report."""
+    def scan_directory_parallel(self, directory: str, threads: int = 16) -> None:
+        """Recursively scan a directory using a pool of worker threads.
+        
+        Each task lists directories and checks their files until it has
+        handled about `io_batch` entries, then hands the remaining
+        subdirectories back to the pool, so up to `threads` scandir/stat
+        calls are in flight at once. This hides per-call latency on
+        network filesystems while keeping tasks for small directories from
+        being dominated by scheduling; results are appended in completion
+        order.
+        """
+        self.scan_directories_parallel([directory], threads)
+    
+    def scan_directories_parallel(self, directories: List[str], threads: int = 16) -> None:
+        """Recursively scan several directories with one shared thread pool.
+        
+        Works like scan_directory_parallel(), but every root is queued at
+        once, so separate trees (e.g. on different disks) are walked
+        concurrently instead of one after another.
+        """
+        scan_file = self._file_scanner()
+        
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            # Maps each queued batch to the root it belongs to, for errors
+            pending = {}
+            for directory in directories:
+                self.logger.info(f"Scanning directory: {directory} ({threads} threads)")
+                if not self._is_excluded_root(directory):
+                    pending[pool.submit(self._scan_directory_batch, [directory], scan_file)] = directory
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    directory = pending.pop(future)
+                    try:
+                        subdirs = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error scanning {directory}: {e}")
+                        continue
+                    
+                    if self._stop_requested.is_set():
+                        continue
+                    
+                    for subdir in subdirs:
+                        pending[pool.submit(self._scan_directory_batch, [subdir], scan_file)] = directory
+    
+    def _scan_directory_batch(self, stack: List[str],
+                              scan_file: Callable[[str, os.stat_result], Optional[UnsafeFile]]) -> List[str]:
+        """Scan directories from stack until about io_batch entries are handled.
+        
+        Subdirectories found on the way are pushed onto the stack; whatever
+        is left unscanned is returned for the caller to schedule.
+        """
+        io_batch = self.config.get('io_batch', 32)
+        found: List[UnsafeFile] = []
+        total_files = 0
+        handled = 0
+        
+        while stack and handled < io_batch and not self._stop_requested.is_set():
+            subdirs: List[str] = []
+            
+            for file_path, stat_info in self._scan_entries(stack.pop(), subdirs):
+                total_files += 1
+                handled += 1
+                
+                unsafe_file = scan_file(file_path, stat_info)
+                if unsafe_file:
+                    found.append(unsafe_file)
+                    if self._debug:
+                        self.logger.debug("Found unsafe file: %s - %s", file_path, unsafe_file.issues)
+            
+            handled += len(subdirs)
+            stack.extend(reversed(subdirs))
+        
+        # Merge the batch's results under a single lock acquisition
+        with self._stats_lock:
+            self.scan_stats['total_files'] += total_files
+            for unsafe_file in found:
+                self._add_unsafe_file(unsafe_file)
+        
+        return stack
+    
+    def _add_unsafe_file(self, unsafe_file: UnsafeFile) -> None:
+        """Record an unsafe file found by a directory scan.
+        
+        While a report is being streamed the record is written out straight
+        away instead of being kept in unsafe_files.
+        """
+        if self._report_stream is None:
+            self.unsafe_files.append(unsafe_file)
+            return
+        
+        if self._stream_json:
+            separator = b",\n    " if self._stream_has_records else b"\n    "
+            self._report_stream.write(separator + _encode_json_record(unsafe_file.to_dict()))
+            self._stream_has_records = True
+        else:
+            self._report_stream.write(_encode_json_line(unsafe_file.to_dict()))
+        self._streamed_risk_counts[unsafe_file.risk_level] += 1
+    
+    def _open_report_stream(self, output_file: str, as_json: bool) -> None:
+        """Start writing unsafe files to output_file as they are found."""
+        self._report_stream = open(output_file, 'wb')
+        self._stream_json = as_json
+        
+        # Counts from an earlier run on this scanner belong to its report
+        self._stream_has_records = False
+        self._streamed_risk_counts = Counter()
+        
+        # Records come first so the summary can be written once they are known
+        if as_json:
+            self._report_stream.write(b'{\n  "unsafe_files": [')
+    
+    def _close_report_stream(self) -> None:
+        """Finish and close the report opened by _open_report_stream()."""
+        f = self._report_stream
+        self._report_stream = None
+        
+        try:
+            if self._stream_json:
+                f.write(b"\n  ]" if self._stream_has_records else b"]")
+                
+                report = self.generate_report(lazy=True)
+                del report['unsafe_files']
+                for key, value in report.items():
+                    f.write(b",\n  " + _encode_json_member(key, value))
+                f.write(b"\n}")
+        finally:
+            f.close()
+    
+    def stop(self) -> None:
+        """Ask a running scan to stop.
+        
+        Walks check this between directories, so the scan ends soon after
+        the directory being listed; files found so far are kept. A stopped
+        scanner stays stopped.
+        """
+        self._stop_requested.set()
+    
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() has been called."""
+        return self._stop_requested.is_set()
+    
+    def _risk_counts(self) -> Counter:
+        """Count unsafe files per risk level, including streamed records."""
+        counts = Counter(f.risk_level for f in self.unsafe_files)
+        counts.update(self._streamed_risk_counts)
+        return counts
+    
+    def _is_excluded_root(self, directory: str) -> bool:
+        """Check whether the directory a walk starts from is itself excluded."""
+        exclude_dirs = self.config['exclude_dirs']
+        return any(part in exclude_dirs for part in _split_path(directory))
+    
+    def iter_files(self, directory: str,
+                   stop_requested: Optional[threading.Event] = None) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat_info) for every file a scan of directory would check.
+        
+        The walk ends early once stop_requested is set; by default that is
+        the scanner's own stop() flag.
+        """
+        return self._scan_walk(directory, stop_requested)
+    
+    def _scan_walk(self, directory: str,
+                   stop_requested: Optional[threading.Event] = None) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat_info) for every non-excluded file below directory.
+        
+        Walks the tree with os.scandir() and an explicit stack, so each file
+        is stat'ed exactly once through its DirEntry. Traversal order and
+        symlink handling match os.walk(topdown=True).
+        """
+        # Everything below an excluded directory is excluded
+        if self._is_excluded_root(directory):
+            return
+        
+        if stop_requested is None:
+            stop_requested = self._stop_requested
+        
+        stack = [directory]
+        
+        while stack and not stop_requested.is_set():
+            path = stack.pop()
+            subdirs: List[str] = []
+            
+            yield from self._scan_entries(path, subdirs)
+            
+            # Reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _scan_entries(self, path: str, subdirs: List[str]) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat_info) for the non-excluded files directly in path.
+        
+        Subdirectories that should be descended into are appended to subdirs.
+        Where supported the directory is listed through an open fd, so each
+        DirEntry.stat() is an fstatat() relative to it rather than a lookup
+        of the full path from the root.
+        """
+        follow_symlinks = self.config['follow_symlinks']
+        exclude_dirs = self.config['exclude_dirs']
+        exclude_files = self.config['exclude_files']
+        join = os.path.join
+        
+        dir_fd = None
+        try:
+            if SCANDIR_FD_SUPPORTED:
+                dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            
+            with os.scandir(path if dir_fd is None else dir_fd) as entries:
+                for entry in entries:
+                    # fd-based entries only carry their name, not the full path
+                    entry_path = join(path, entry.name)
+                    
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    # Parent directories were already checked on the way down,
+                    # so only the entry's own name needs testing
+                    if is_dir:
+                        # Like os.walk, only descend into symlinked dirs when following links
+                        if (follow_symlinks or not entry.is_symlink()) and entry.name not in exclude_dirs:
+                            subdirs.append(entry_path)
+                        continue
+                    
+                    if entry.name in exclude_files:
+                        continue
+                    
+                    # A symlink's own mode is always 0777 and never enforced;
+                    # skip it without a stat unless links are followed
+                    if not follow_symlinks and entry.is_symlink():
+                        continue
+                    
+                    try:
+                        stat_info = entry.stat(follow_symlinks=follow_symlinks)
+                    except OSError as e:
+                        self.logger.warning("Error scanning %s: %s", entry_path, e)
+                        continue
+                    
+                    yield entry_path, stat_info
+        except OSError as e:
+            self.logger.warning("Could not read directory %s: %s", path, e)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    
+    def generate_report(self, lazy: bool = False) -> Dict:
+        """Generate a comprehensive scan report.
+        
+        With lazy=True the 'unsafe_files' entry is a generator that builds
+        each record's dict only as it is written, so a report can be saved
+        without holding every record dict at once. Such a report can only
+        be saved once.
+        """
+        if lazy:
+            unsafe_files = self._iter_unsafe_dicts()
+        else:
+            unsafe_files = [file.to_dict() for file in self.unsafe_files]
+        
+        risk_counts = self._risk_counts()
         report = {
             'scan_info': {
                 'timestamp': datetime.now().isoformat(),
@@ -402,34 +1044,113 @@ class UnsafeFileScanner:
                 'scan_duration_seconds': self.scan_stats['scan_duration']
             },
             'statistics': self.scan_stats,
-            'unsafe_files': [asdict(file) for file in self.unsafe_files],
+            'unsafe_files': unsafe_files,
             'summary': {
-                'total_unsafe_files': len(self.unsafe_files),
-                'high_risk_files': len([f for f in self.unsafe_files if f.risk_level == 'HIGH']),
-                'medium_risk_files': len([f for f in self.unsafe_files if f.risk_level == 'MEDIUM']),
-                'low_risk_files': len([f for f in self.unsafe_files if f.risk_level == 'LOW'])
+                'total_unsafe_files': sum(risk_counts.values()),
+                'high_risk_files': risk_counts['HIGH'],
+                'medium_risk_files': risk_counts['MEDIUM'],
+                'low_risk_files': risk_counts['LOW']
             }
         }
         return report
     
+    def _iter_unsafe_dicts(self) -> Iterator[Dict]:
+        """Yield a report dict for each unsafe file, one at a time."""
+        for file in self.unsafe_files:
+            yield file.to_dict()
+    
     def save_report(self, report: Dict, output_file: str) -> None:
         """Save the scan report to a file."""
         try:
-            file_ext = Path(output_file).suffix.lower()
-            
-            if file_ext == '.csv':
-                self._save_csv_report(report, output_file)
-            elif file_ext == '.html':
-                self._save_html_report(report, output_file)
-            else:
-                # Default to JSON
-                with open(output_file, 'w') as f:
-                    json.dump(report, f, indent=2)
-            
+            self._write_report(report, output_file)
             self.logger.info(f"Report saved to: {output_file}")
         except Exception as e:
             self.logger.error(f"Error saving report to {output_file}: {e}")
     
+    def _write_report(self, report: Dict, output_file: str) -> None:
+        """Write the report in the format picked from the file extension."""
+        file_ext = Path(output_file).suffix.lower()
+        
+        if file_ext == '.csv':
+            self._save_csv_report(report, output_file)
+        elif file_ext == '.html':
+            self._save_html_report(report, output_file)
+        elif file_ext in NDJSON_EXTENSIONS:
+            self._save_ndjson_report(report, output_file)
+        else:
+            # Default to JSON
+            self._save_json_report(report, output_file)
+    
+    def save_reports(self, report: Dict, output_files: List[str]) -> None:
+        """Save the scan report to several files concurrently.
+        
+        Each output file is written by its own worker, with the format
+        picked from the file extension as in save_report(). Unlike
+        save_report(), failures are raised once every worker is done, as a
+        RuntimeError naming each file that could not be written.
+        """
+        if not output_files:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(output_files)) as pool:
+            futures = {
+                pool.submit(self._write_report, report, output_file): output_file
+                for output_file in output_files
+            }
+        
+        failed = []
+        for future, output_file in futures.items():
+            error = future.exception()
+            if error is None:
+                self.logger.info("Report saved to: %s", output_file)
+            else:
+                self.logger.error("Error saving report to %s: %s", output_file, error)
+                failed.append(f"{output_file}: {error}")
+        
+        if failed:
+            raise RuntimeError("Could not save reports:\n" + "\n".join(failed))
+    
+    def _save_json_report(self, report: Dict, output_file: str) -> None:
+        """Save report in JSON format."""
+        if isinstance(report['unsafe_files'], GeneratorType):
+            self._stream_json_report(report, output_file)
+        elif ORJSON_AVAILABLE:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
+    
+    def _stream_json_report(self, report: Dict, output_file: str) -> None:
+        """Write a lazy report as indented JSON, one unsafe file at a time.
+        
+        The layout matches what a single indented dump of the whole report
+        produces; only the framing around the records is written by hand.
+        """
+        with open(output_file, 'wb') as f:
+            f.write(b"{")
+            for index, (key, value) in enumerate(report.items()):
+                f.write(b",\n  " if index else b"\n  ")
+                
+                if key != 'unsafe_files':
+                    f.write(_encode_json_member(key, value))
+                    continue
+                
+                f.write(_encode_json(key) + b": [")
+                count = 0
+                for record in value:
+                    f.write(b",\n    " if count else b"\n    ")
+                    f.write(_encode_json_record(record))
+                    count += 1
+                f.write(b"\n  ]" if count else b"]")
+            f.write(b"\n}")
+    
+    def _save_ndjson_report(self, report: Dict, output_file: str) -> None:
+        """Save report as newline-delimited JSON, one unsafe file per line."""
+        with open(output_file, 'wb') as f:
+            for file_info in report['unsafe_files']:
+                f.write(_encode_json_line(file_info))
+    
     def _save_csv_report(self, report: Dict, output_file: str) -> None:
         """Save report in CSV format."""
         with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
@@ -468,118 +1189,33 @@ class UnsafeFileScanner:
     
     def _save_html_report(self, report: Dict, output_file: str) -> None:
         """Save report in HTML format."""
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Unsafe File Scanner Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .header {{ text-align: center; color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 20px; margin-bottom: 30px; }}
-        .summary {{ background: #ecf0f1; padding: 20px; border-radius: 5px; margin-bottom: 30px; }}
-        .summary h2 {{ color: #2c3e50; margin-top: 0; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .stat-card {{ background: white; padding: 15px; border-radius: 5px; text-align: center; border-left: 4px solid #3498db; }}
-        .stat-number {{ font-size: 2em; font-weight: bold; color: #2c3e50; }}
-        .stat-label {{ color: #7f8c8d; margin-top: 5px; }}
-        .results {{ margin-top: 30px; }}
-        .results h2 {{ color: #2c3e50; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background-color: #3498db; color: white; font-weight: bold; }}
-        tr:nth-child(even) {{ background-color: #f2f2f2; }}
-        .risk-high {{ color: #e74c3c; font-weight: bold; }}
-        .risk-medium {{ color: #f39c12; font-weight: bold; }}
-        .risk-low {{ color: #27ae60; font-weight: bold; }}
-        .issues {{ max-width: 300px; word-wrap: break-word; }}
-        .footer {{ text-align: center; margin-top: 40px; color: #7f8c8d; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔒 Unsafe File Scanner Report</h1>
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="summary">
-            <h2>📊 Scan Summary</h2>
-            <div class="stats">
-                <div class="stat-card">
-                    <div class="stat-number">{report['statistics']['total_files']}</div>
-                    <div class="stat-label">Total Files Scanned</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{report['summary']['total_unsafe_files']}</div>
-                    <div class="stat-label">Unsafe Files Found</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{report['summary']['high_risk_files']}</div>
-                    <div class="stat-label">High Risk</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{report['summary']['medium_risk_files']}</div>
-                    <div class="stat-label">Medium Risk</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{report['summary']['low_risk_files']}</div>
-                    <div class="stat-label">Low Risk</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{report['statistics']['scan_duration']:.2f}s</div>
-                    <div class="stat-label">Scan Duration</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="results">
-            <h2>🔍 Detailed Results</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>File Path</th>
-                        <th>Permissions</th>
-                        <th>Owner</th>
-                        <th>Group</th>
-                        <th>Size</th>
-                        <th>Risk Level</th>
-                        <th>Issues</th>
-                    </tr>
-                </thead>
-                <tbody>
-"""
+        page_template, row_template = _get_html_template()
         
         # Add unsafe files to HTML
-        for file_info in report['unsafe_files']:
-            risk_class = f"risk-{file_info['risk_level'].lower()}"
-            html_content += f"""
-                    <tr>
-                        <td><code>{file_info['path']}</code></td>
-                        <td><code>{file_info['permissions']}</code></td>
-                        <td>{file_info['owner']}</td>
-                        <td>{file_info['group']}</td>
-                        <td>{file_info['size']:,} bytes</td>
-                        <td class="{risk_class}">{file_info['risk_level']}</td>
-                        <td class="issues">{'; '.join(file_info['issues'])}</td>
-                    </tr>
-"""
-        
-        html_content += """
-                </tbody>
-            </table>
-        </div>
+        rows = "".join(
+            row_template.substitute(
+                path=file_info['path'],
+                permissions=file_info['permissions'],
+                owner=file_info['owner'],
+                group=file_info['group'],
+                size=f"{file_info['size']:,}",
+                risk_class=f"risk-{file_info['risk_level'].lower()}",
+                risk_level=file_info['risk_level'],
+                issues='; '.join(file_info['issues'])
+            )
+            for file_info in report['unsafe_files']
+        )
         
-        <div class="footer">
-            <p>Generated by Unsafe File Scanner - A Linux Security Tool</p>
-            <p>For more information, visit the project documentation</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        html_content = page_template.substitute(
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_files=report['statistics']['total_files'],
+            total_unsafe_files=report['summary']['total_unsafe_files'],
+            high_risk_files=report['summary']['high_risk_files'],
+            medium_risk_files=report['summary']['medium_risk_files'],
+            low_risk_files=report['summary']['low_risk_files'],
+            scan_duration=f"{report['statistics']['scan_duration']:.2f}",
+            rows=rows
+        )
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -597,14 +1233,12 @@ class UnsafeFileScanner:
         print(f"Non-owner writable files: {self.scan_stats['non_owner_writable']}")
         print(f"Scan duration: {self.scan_stats['scan_duration']:.2f} seconds")
         
-        if self.unsafe_files:
+        risk_counts = self._risk_counts()
+        if risk_counts:
             print(f"\nRisk Level Breakdown:")
-            high_risk = len([f for f in self.unsafe_files if f.risk_level == 'HIGH'])
-            medium_risk = len([f for f in self.unsafe_files if f.risk_level == 'MEDIUM'])
-            low_risk = len([f for f in self.unsafe_files if f.risk_level == 'LOW'])
-            print(f"  HIGH: {high_risk}")
-            print(f"  MEDIUM: {medium_risk}")
-            print(f"  LOW: {low_risk}")
+            print(f"  HIGH: {risk_counts['HIGH']}")
+            print(f"  MEDIUM: {risk_counts['MEDIUM']}")
+            print(f"  LOW: {risk_counts['LOW']}")
         
         print("="*60)
     
@@ -615,24 +1249,55 @@ class UnsafeFileScanner:
         self.logger.info("Starting unsafe file scan...")
         self.logger.info(f"Target directories: {directories}")
         
-        for directory in directories:
-            if not os.path.exists(directory):
-                self.logger.error(f"Directory does not exist: {directory}")
-                continue
+        # NDJSON reports, and JSON reports when stream_output is set, are
+        # written while scanning rather than kept in memory
+        output_file = self.config['output_file']
+        file_ext = Path(output_file).suffix.lower() if output_file else ''
+        stream_report = file_ext in NDJSON_EXTENSIONS or (
+            bool(output_file) and self.config.get('stream_output', False)
+            and file_ext not in ('.csv', '.html')
+        )
+        if stream_report:
+            self._open_report_stream(output_file, as_json=file_ext not in NDJSON_EXTENSIONS)
+        
+        try:
+            roots = []
+            for directory in directories:
+                # One stat answers both "exists" and "is a directory"
+                try:
+                    is_dir = stat.S_ISDIR(os.stat(directory).st_mode)
+                except OSError:
+                    self.logger.error(f"Directory does not exist: {directory}")
+                    continue
+                
+                if not is_dir:
+                    self.logger.error(f"Path is not a directory: {directory}")
+                    continue
+                
+                roots.append(directory)
+            
+            threads = self.config.get('scan_threads', 1)
+            if threads > 1:
+                self.scan_directories_parallel(roots, threads)
+            else:
+                for directory in roots:
+                    if self._stop_requested.is_set():
+                        break
+                    self.scan_directory(directory)
             
-            if not os.path.isdir(directory):
-                self.logger.error(f"Path is not a directory: {directory}")
-                continue
+            if self._stop_requested.is_set():
+                self.logger.info("Scan stopped")
             
-            self.scan_directory(directory)
-        
-        self.scan_stats['scan_duration'] = time.time() - start_time
+            self.scan_stats['scan_duration'] = time.time() - start_time
+        finally:
+            if stream_report:
+                self._close_report_stream()
         
         # Generate and save report
-        report = self.generate_report()
-        
-        if self.config['output_file']:
-            self.save_report(report, self.config['output_file'])
+        if stream_report:
+            self.logger.info(f"Report saved to: {output_file}")
+        elif output_file:
+            self.save_report(self.generate_report(lazy=True), output_file)
         
         # Print summary
         self.print_summary()
@@ -678,7 +1343,7 @@ Examples:
     parser.add_argument(
         '--output', '-o',
         type=str,
-        help='Output file for scan report (JSON format)'
+        help='Output file for scan report (JSON format; .ndjson/.jsonl are written while scanning)'
     )
     
     parser.add_argument(
@@ -687,6 +1352,19 @@ Examples:
         help='Enable verbose output'
     )
     
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write JSON reports while scanning instead of keeping results in memory'
+    )
+    
+    parser.add_argument(
+        '--stat-threads',
+        type=int,
+        metavar='N',
+        help='Number of threads listing and stat\'ing files in parallel (default: 1)'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -696,24 +1374,26 @@ Examples:
     
     args = parser.parse_args()
     
-    # Initialize scanner
-    scanner = UnsafeFileScanner(args.config)
-    
     # Override config with command line arguments
+    overrides = {'log_level': args.log_level}
     if args.output:
-        scanner.config['output_file'] = args.output
+        overrides['output_file'] = args.output
     if args.verbose:
-        scanner.config['verbose'] = True
-    if args.log_level:
-        scanner.config['log_level'] = args.log_level
-        scanner.setup_logging()
+        overrides['verbose'] = True
+    if args.stream:
+        overrides['stream_output'] = True
+    if args.stat_threads:
+        overrides['scan_threads'] = max(1, args.stat_threads)
+    
+    # Initialize scanner
+    scanner = UnsafeFileScanner(args.config, overrides)
     
     try:
         # Run the scan
         scanner.run_scan(args.directories)
         
         # Exit with appropriate code
-        if scanner.unsafe_files:
+        if scanner.scan_stats['unsafe_files']:
             sys.exit(1)  # Found unsafe files
         else:
             sys.exit(0)  # No unsafe files found
@@ -8,11 +8,11 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import json
+from collections import deque
 import os
 import sys
 from pathlib import Path
 from unsafe_file_scanner import UnsafeFileScanner
-import webbrowser
 
 # Import new features
 try:
@@ -30,6 +30,75 @@ except ImportError:
     RULE_ENGINE_AVAILABLE = False
     RuleEngine = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _apply_columns(tree, specs):
+    """Configure Treeview column headings and widths in one Tcl call.
+    
+    specs is a sequence of (column, heading text, width) tuples.
+    """
+    script = "; ".join(
+        f"{tree} heading {column} -text {{{text}}}; {tree} column {column} -width {width}"
+        for column, text, width in specs
+    )
+    tree.tk.eval(script)
+
+
+# Summary tab text, filled from scan_stats and the report summary
+SUMMARY_TEMPLATE = """
+Scan Summary:
+=============
+Total files scanned: {total_files}
+Unsafe files found: {unsafe_files}
+SUID files: {suid_files}
+SGID files: {sgid_files}
+World-writable files: {world_writable}
+Non-owner writable files: {non_owner_writable}
+Scan duration: {scan_duration:.2f} seconds
+
+Risk Level Breakdown:
+- HIGH: {high_risk_files}
+- MEDIUM: {medium_risk_files}
+- LOW: {low_risk_files}
+"""
+
+# Results table rows inserted per page; more are loaded while scrolling
+ROW_PAGE_SIZE = 200
+
+# Item id of the placeholder row shown while rows remain unloaded
+MORE_ROWS_ITEM = "more-rows"
+
+# Real-time monitoring findings kept for display and export; alerts are
+# also logged, so older ones are not lost
+REALTIME_HISTORY = 10000
+
+# Interval between progress label refreshes during a scan (milliseconds)
+PROGRESS_POLL_MS = 100
+
+
+def _report_json(report):
+    """Return a report as JSON text indented by two spaces."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(report, indent=2)
+
+
+def _result_rows(unsafe_files):
+    """Build the results table rows for a list of unsafe files.
+    
+    Touches no widgets, so it can run on the scan thread.
+    """
+    return [
+        (f.path, f.permissions, f.owner, f.group, f.risk_level, ", ".join(f.issues))
+        for f in unsafe_files
+    ]
+
 
 class UnsafeFileScannerGUI:
     """Main GUI application class."""
@@ -56,7 +125,26 @@ class UnsafeFileScannerGUI:
         self.scanner = None
         self.scan_thread = None
         self.is_scanning = False
-        self.scan_results = []
+        self.scan_results = deque(maxlen=REALTIME_HISTORY)
+        
+        # Results table rows for scan_results, built once per alert
+        self._realtime_rows = deque(maxlen=REALTIME_HISTORY)
+        
+        # Results table rows not yet inserted into the Treeview
+        self._pending_rows = []
+        self._rows_loaded = 0
+        self._row_insert_job = None
+        
+        # Report JSON not yet shown in the Raw JSON tab
+        self._pending_json = None
+        
+        # (scanner, unsafe file count, JSON text) of the last completed scan
+        self._scan_report = None
+        
+        # Pending progress label refresh while a scan runs, and the file
+        # count it last showed
+        self._progress_job = None
+        self._progress_files = 0
         
         # Real-time monitoring
         self.realtime_monitor = None
@@ -384,7 +472,7 @@ class UnsafeFileScannerGUI:
         self.export_format_menu = tk.OptionMenu(
             self.export_format_frame,
             self.export_format_combo,
-            "JSON", "CSV", "HTML"
+            "JSON", "CSV", "HTML", "All Formats"
         )
         self.export_format_menu.config(
             font=("SF Pro Text", 10),
@@ -478,19 +566,14 @@ class UnsafeFileScannerGUI:
         )
         
         # Configure treeview columns
-        self.details_tree.heading("path", text="File Path")
-        self.details_tree.heading("permissions", text="Permissions")
-        self.details_tree.heading("owner", text="Owner")
-        self.details_tree.heading("group", text="Group")
-        self.details_tree.heading("risk", text="Risk Level")
-        self.details_tree.heading("issues", text="Issues")
-        
-        self.details_tree.column("path", width=300)
-        self.details_tree.column("permissions", width=100)
-        self.details_tree.column("owner", width=80)
-        self.details_tree.column("group", width=80)
-        self.details_tree.column("risk", width=80)
-        self.details_tree.column("issues", width=200)
+        _apply_columns(self.details_tree, [
+            ("path", "File Path", 300),
+            ("permissions", "Permissions", 100),
+            ("owner", "Owner", 80),
+            ("group", "Group", 80),
+            ("risk", "Risk Level", 80),
+            ("issues", "Issues", 200),
+        ])
         
         # Scrollbar for treeview
         self.details_scrollbar = ttk.Scrollbar(
@@ -498,7 +581,7 @@ class UnsafeFileScannerGUI:
             orient="vertical", 
             command=self.details_tree.yview
         )
-        self.details_tree.configure(yscrollcommand=self.details_scrollbar.set)
+        self.details_tree.configure(yscrollcommand=self._on_details_scroll)
         
         # Raw JSON tab
         self.json_tab = ttk.Frame(self.results_notebook)
@@ -512,6 +595,7 @@ class UnsafeFileScannerGUI:
         self.results_notebook.add(self.summary_tab, text="Summary")
         self.results_notebook.add(self.details_tab, text="Detailed Results")
         self.results_notebook.add(self.json_tab, text="Raw JSON")
+        self.results_notebook.bind("<<NotebookTabChanged>>", self._on_results_tab_changed)
         
         # Status bar
         self.status_bar_frame = ttk.Frame(self.main_frame)
@@ -760,7 +844,7 @@ class UnsafeFileScannerGUI:
         self.is_scanning = True
         self.scan_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
-        self.progress_bar.start()
+        self._progress_files = 0
         self.status_indicator.config(text="● Scanning...", foreground="#3498db")
         self.status_label.config(text="Scanning...")
         
@@ -772,34 +856,88 @@ class UnsafeFileScannerGUI:
         # Clear previous results
         self.clear_results()
         
+        # Create scanner with the chosen output file. It is built here rather
+        # than on the scan thread so Stop can reach it from the first moment
+        overrides = {}
+        output_file = self.output_file_entry.get().strip()
+        if output_file:
+            overrides['output_file'] = output_file
+        try:
+            self.scanner = UnsafeFileScanner(overrides=overrides)
+        except Exception as e:
+            self.scan_error(str(e))
+            return
+        
         # Start scan in separate thread
-        self.scan_thread = threading.Thread(target=self.run_scan, args=(directories,))
+        self.scan_thread = threading.Thread(target=self.run_scan, args=(self.scanner, directories))
         self.scan_thread.daemon = True
         self.scan_thread.start()
+        
+        # Refresh progress labels at a fixed rate, however fast files are scanned
+        self._schedule_progress_poll()
     
-    def run_scan(self, directories):
-        """Run the actual scan."""
+    def run_scan(self, scanner, directories):
+        """Run the actual scan.
+        
+        Runs on the scan thread, so it only hands results back to the UI
+        through root.after.
+        """
         try:
-            # Create scanner
-            self.scanner = UnsafeFileScanner()
+            # Run scan
+            scanner.run_scan(directories)
             
-            # Set output file
-            output_file = self.output_file_entry.get().strip()
-            if output_file:
-                self.scanner.config['output_file'] = output_file
+            # stop_scan has already reset the UI
+            if scanner.stopped:
+                return
             
-            # Run scan
-            self.scanner.run_scan(directories)
+            # Prepare the report, its JSON text and the table rows here so
+            # the UI thread only has to update widgets
+            report = scanner.generate_report()
+            report_json = _report_json(report)
+            rows = _result_rows(scanner.unsafe_files)
             
             # Update UI with results
-            self.root.after(0, self.scan_completed)
+            self.root.after(0, lambda: self.scan_completed(rows, report, report_json))
             
         except Exception as e:
             self.root.after(0, lambda: self.scan_error(str(e)))
     
-    def scan_completed(self):
+    def _schedule_progress_poll(self):
+        """Schedule the next progress label refresh."""
+        self._progress_job = self.root.after(PROGRESS_POLL_MS, self._poll_progress)
+    
+    def _poll_progress(self):
+        """Show the running scan's counters and poll again while it lasts.
+        
+        The scan thread only bumps scan_stats; reading them here keeps UI
+        work to one label update per tick instead of one per file. The
+        progress bar is stepped from here too, so it only moves while
+        files are actually being scanned.
+        """
+        self._progress_job = None
+        if not self.is_scanning:
+            return
+        
+        scanner = self.scanner
+        if scanner:
+            stats = scanner.scan_stats
+            if stats['total_files'] != self._progress_files:
+                self._progress_files = stats['total_files']
+                self.progress_bar.step(2)
+                self.files_scanned_label.config(text=f"Files: {stats['total_files']}")
+                self.unsafe_files_label.config(text=f"Unsafe: {stats['unsafe_files']}")
+        self._schedule_progress_poll()
+    
+    def _cancel_progress_poll(self):
+        """Stop refreshing the progress labels."""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+    
+    def scan_completed(self, rows=None, report=None, report_json=None):
         """Handle scan completion."""
         self.is_scanning = False
+        self._cancel_progress_poll()
         self.scan_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
         self.progress_bar.stop()
@@ -812,15 +950,19 @@ class UnsafeFileScannerGUI:
             self.files_scanned_label.config(text=f"Files: {stats['total_files']}")
             self.unsafe_files_label.config(text=f"Unsafe: {stats['unsafe_files']}")
             self.scan_time_label.config(text=f"Time: {stats['scan_duration']:.2f}s")
+            
+            if report_json is not None:
+                self._scan_report = (self.scanner, stats['unsafe_files'], report_json)
         
         # Update results
-        self.update_results()
+        self.update_results(rows, report, report_json)
         
         messagebox.showinfo("Scan Complete", "Security scan completed successfully!")
     
     def scan_error(self, error_message):
         """Handle scan error."""
         self.is_scanning = False
+        self._cancel_progress_poll()
         self.scan_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
         self.progress_bar.stop()
@@ -833,63 +975,118 @@ class UnsafeFileScannerGUI:
         """Stop the current scan."""
         if self.is_scanning:
             self.is_scanning = False
+            self._cancel_progress_poll()
+            
+            # The scan thread notices between directories and ends early
+            if self.scanner:
+                self.scanner.stop()
             self.scan_btn.config(state="normal")
             self.stop_btn.config(state="disabled")
             self.progress_bar.stop()
             self.status_indicator.config(text="● Scan Stopped", foreground="#e74c3c")
             self.status_label.config(text="Scan stopped")
     
-    def update_results(self):
-        """Update the results display."""
+    def update_results(self, rows=None, report=None, report_json=None):
+        """Update the results display.
+        
+        rows, report and report_json may be passed in when they were
+        already built off the UI thread; anything missing is built here.
+        """
         if not self.scanner:
             return
         
+        if report is None:
+            report = self.scanner.generate_report()
+            report_json = None
+        if report_json is None:
+            report_json = _report_json(report)
+        
         # Update summary
         stats = self.scanner.scan_stats
-        summary_text = f"""
-Scan Summary:
-=============
-Total files scanned: {stats['total_files']}
-Unsafe files found: {stats['unsafe_files']}
-SUID files: {stats['suid_files']}
-SGID files: {stats['sgid_files']}
-World-writable files: {stats['world_writable']}
-Non-owner writable files: {stats['non_owner_writable']}
-Scan duration: {stats['scan_duration']:.2f} seconds
-
-Risk Level Breakdown:
-- HIGH: {len([f for f in self.scanner.unsafe_files if f.risk_level == 'HIGH'])}
-- MEDIUM: {len([f for f in self.scanner.unsafe_files if f.risk_level == 'MEDIUM'])}
-- LOW: {len([f for f in self.scanner.unsafe_files if f.risk_level == 'LOW'])}
-"""
-        
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(1.0, summary_text)
+        summary_text = SUMMARY_TEMPLATE.format_map({**stats, **report['summary']})
+        self.summary_text.replace(1.0, tk.END, summary_text)
         
         # Update detailed results
+        self._cancel_row_insert()
         self.details_tree.delete(*self.details_tree.get_children())
-        for file in self.scanner.unsafe_files:
-            self.details_tree.insert("", "end", values=(
-                file.path,
-                file.permissions,
-                file.owner,
-                file.group,
-                file.risk_level,
-                ", ".join(file.issues)
-            ))
+        if rows is None:
+            rows = _result_rows(self.scanner.unsafe_files)
+        self._pending_rows = rows
+        self._rows_loaded = 0
+        self._load_more_rows()
         
-        # Update JSON results
-        report = self.scanner.generate_report()
+        # Update JSON results; filled in once the Raw JSON tab is shown
         self.json_text.delete(1.0, tk.END)
-        self.json_text.insert(1.0, json.dumps(report, indent=2))
+        self._pending_json = report_json
+        if self.results_notebook.select() == str(self.json_tab):
+            self._show_pending_json()
         
         # Update summary label
         self.summary_label.config(
             text=f"Scan completed - {stats['unsafe_files']} unsafe files found"
         )
     
+    def _load_more_rows(self):
+        """Insert the next page of results table rows.
+        
+        Only pages the user scrolls to are turned into Treeview items, so
+        large result sets cost O(visible) widgets rather than O(findings).
+        A placeholder row at the end shows how many rows remain.
+        """
+        self._row_insert_job = None
+        tree = self.details_tree
+        if tree.exists(MORE_ROWS_ITEM):
+            tree.delete(MORE_ROWS_ITEM)
+        
+        insert = tree.insert
+        start = self._rows_loaded
+        end = start + ROW_PAGE_SIZE
+        for values in self._pending_rows[start:end]:
+            insert("", "end", values=values)
+        self._rows_loaded = min(end, len(self._pending_rows))
+        
+        remaining = len(self._pending_rows) - self._rows_loaded
+        if remaining:
+            insert("", "end", iid=MORE_ROWS_ITEM,
+                   values=(f"… {remaining} more, scroll to load", "", "", "", "", ""))
+    
+    def _on_details_scroll(self, first, last):
+        """Track the results table scroll position and load rows near the end."""
+        self.details_scrollbar.set(first, last)
+        
+        # Insert from an idle callback rather than inside Tk's scroll update
+        if (float(last) >= 0.9 and self._rows_loaded < len(self._pending_rows)
+                and self._row_insert_job is None):
+            self._row_insert_job = self.root.after_idle(self._load_more_rows)
+    
+    def _on_results_tab_changed(self, event=None):
+        """Fill the Raw JSON tab the first time it is shown after a scan."""
+        if self.results_notebook.select() == str(self.json_tab):
+            self._show_pending_json()
+    
+    def _show_pending_json(self):
+        """Insert the report JSON waiting for the Raw JSON tab, if any.
+        
+        Laying out a multi-megabyte report in the Text widget takes
+        seconds, so it is only done when someone looks at it.
+        """
+        if self._pending_json is not None:
+            self.json_text.insert(1.0, self._pending_json)
+            self._pending_json = None
+    
+    def _cancel_row_insert(self):
+        """Stop loading results table rows and forget any not yet shown."""
+        if self._row_insert_job is not None:
+            self.root.after_cancel(self._row_insert_job)
+            self._row_insert_job = None
+        self._pending_rows = []
+        self._rows_loaded = 0
+    
     def clear_results(self):
         """Clear all results."""
+        self._cancel_row_insert()
+        self._pending_json = None
+        self._scan_report = None
         self.summary_text.delete(1.0, tk.END)
         self.details_tree.delete(*self.details_tree.get_children())
         self.json_text.delete(1.0, tk.END)
@@ -908,6 +1105,10 @@ Risk Level Breakdown:
         # Get selected export format
         export_format = self.export_format_combo.get().lower()
         
+        if export_format == "all formats":
+            self.export_all_formats(self.scanner, "Export Results")
+            return
+        
         # Set default extension based on format
         if export_format == "json":
             default_ext = ".json"
@@ -930,26 +1131,54 @@ Risk Level Breakdown:
         
         if filename:
             try:
-                # Generate report
-                report = self.scanner.generate_report()
-                
                 # Save based on format
                 if export_format == "json":
-                    with open(filename, 'w') as f:
-                        json.dump(report, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(self._scan_report_json())
                 elif export_format == "csv":
-                    self.scanner.save_report(report, filename)
+                    self.scanner.save_report(self.scanner.generate_report(), filename)
                 elif export_format == "html":
-                    self.scanner.save_report(report, filename)
+                    self.scanner.save_report(self.scanner.generate_report(), filename)
                 else:
                     # Fallback to JSON
-                    with open(filename, 'w') as f:
-                        json.dump(report, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(self._scan_report_json())
                 
                 messagebox.showinfo("Success", f"Results exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export results: {e}")
     
+    def _scan_report_json(self):
+        """Return the JSON text of the current scanner's report.
+        
+        The text built on the scan thread is reused while the scanner's
+        findings are unchanged, rather than serializing the report again.
+        """
+        scanner = self.scanner
+        cached = self._scan_report
+        if cached and cached[0] is scanner and cached[1] == scanner.scan_stats['unsafe_files']:
+            return cached[2]
+        return _report_json(scanner.generate_report())
+    
+    def export_all_formats(self, scanner, title):
+        """Export results as JSON, CSV and HTML side by side."""
+        filename = filedialog.asksaveasfilename(
+            title=f"{title} (All Formats)",
+            filetypes=[("All files", "*.*")]
+        )
+        
+        if filename:
+            try:
+                base_name = os.path.splitext(filename)[0]
+                output_files = [base_name + ext for ext in (".json", ".csv", ".html")]
+                
+                # Formats are written concurrently by the scanner
+                report = scanner.generate_report()
+                scanner.save_reports(report, output_files)
+                
+                messagebox.showinfo("Success", "Results exported to:\n" + "\n".join(output_files))
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export results: {e}")
     
     def toggle_realtime_monitoring(self):
         """Toggle real-time monitoring."""
@@ -974,7 +1203,8 @@ Risk Level Breakdown:
                 if not self.realtime_monitor:
                     self.realtime_monitor = RealTimeMonitorGUI(
                         self.scanner, 
-                        self.on_realtime_alert
+                        self.on_realtime_alert,
+                        root=self.root
                     )
                 
                 self.realtime_monitor.start_monitoring(directories)
@@ -1003,10 +1233,15 @@ Risk Level Breakdown:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to stop monitoring: {e}")
     
-    def on_realtime_alert(self, unsafe_file):
-        """Handle real-time monitoring alerts."""
+    def on_realtime_alert(self, unsafe_files):
+        """Handle real-time monitoring alerts.
+        
+        Called on the Tk thread with the files found since the last poll,
+        so a burst of alerts costs one refresh and one notification.
+        """
         # Add to results
-        self.scan_results.append(unsafe_file)
+        self.scan_results.extend(unsafe_files)
+        self._realtime_rows.extend(_result_rows(unsafe_files))
         
         # Update GUI
         self.update_results_display()
@@ -1017,10 +1252,15 @@ Risk Level Breakdown:
         self.clear_realtime_btn.config(state="normal")
         
         # Show notification
-        messagebox.showwarning(
-            "Security Alert", 
-            f"Unsafe file detected:\n{unsafe_file.path}\nRisk: {unsafe_file.risk_level}"
-        )
+        unsafe_file = unsafe_files[0]
+        if len(unsafe_files) == 1:
+            message = f"Unsafe file detected:\n{unsafe_file.path}\nRisk: {unsafe_file.risk_level}"
+        else:
+            message = (
+                f"{len(unsafe_files)} unsafe files detected, including:\n"
+                f"{unsafe_file.path}\nRisk: {unsafe_file.risk_level}"
+            )
+        messagebox.showwarning("Security Alert", message)
     
     def update_results_display(self):
         """Update the results display with real-time monitoring results."""
@@ -1033,8 +1273,8 @@ Risk Level Breakdown:
             original_files = self.scanner.unsafe_files
             self.scanner.unsafe_files = self.scan_results
             
-            # Update the display
-            self.update_results()
+            # Update the display, reusing the rows built for earlier alerts
+            self.update_results(list(self._realtime_rows))
             
             # Restore original results
             self.scanner.unsafe_files = original_files
@@ -1074,21 +1314,15 @@ Risk Level Breakdown:
         )
         
         # Configure columns
-        tree.heading("timestamp", text="Detected At")
-        tree.heading("path", text="File Path")
-        tree.heading("permissions", text="Permissions")
-        tree.heading("owner", text="Owner")
-        tree.heading("group", text="Group")
-        tree.heading("risk", text="Risk Level")
-        tree.heading("issues", text="Issues")
-        
-        tree.column("timestamp", width=120)
-        tree.column("path", width=300)
-        tree.column("permissions", width=100)
-        tree.column("owner", width=80)
-        tree.column("group", width=80)
-        tree.column("risk", width=80)
-        tree.column("issues", width=200)
+        _apply_columns(tree, [
+            ("timestamp", "Detected At", 120),
+            ("path", "File Path", 300),
+            ("permissions", "Permissions", 100),
+            ("owner", "Owner", 80),
+            ("group", "Group", 80),
+            ("risk", "Risk Level", 80),
+            ("issues", "Issues", 200),
+        ])
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
@@ -1099,20 +1333,10 @@ Risk Level Breakdown:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Populate results
-        for i, file in enumerate(self.scan_results):
-            # Get current timestamp for display
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            
-            tree.insert("", "end", values=(
-                timestamp,
-                file.path,
-                file.permissions,
-                file.owner,
-                file.group,
-                file.risk_level,
-                ", ".join(file.issues)
-            ))
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        for row in self._realtime_rows:
+            tree.insert("", "end", values=(timestamp,) + row)
         
         # Buttons
         button_frame = ttk.Frame(results_frame)
@@ -1131,6 +1355,13 @@ Risk Level Breakdown:
         # Get selected export format
         export_format = self.export_format_combo.get().lower()
         
+        if export_format == "all formats":
+            # Create a temporary scanner to use its export methods
+            temp_scanner = UnsafeFileScanner()
+            temp_scanner.unsafe_files = self.scan_results
+            self.export_all_formats(temp_scanner, "Export Real-time Monitoring Results")
+            return
+        
         # Set default extension based on format
         if export_format == "json":
             default_ext = ".json"
@@ -1162,16 +1393,16 @@ Risk Level Breakdown:
                 
                 # Save based on format
                 if export_format == "json":
-                    with open(filename, 'w') as f:
-                        json.dump(report, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(_report_json(report))
                 elif export_format == "csv":
                     temp_scanner.save_report(report, filename)
                 elif export_format == "html":
                     temp_scanner.save_report(report, filename)
                 else:
                     # Fallback to JSON
-                    with open(filename, 'w') as f:
-                        json.dump(report, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(_report_json(report))
                 
                 messagebox.showinfo("Success", f"Real-time monitoring results exported to {filename}")
             except Exception as e:
@@ -1185,6 +1416,7 @@ Risk Level Breakdown:
         
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all real-time monitoring results?"):
             self.scan_results.clear()
+            self._realtime_rows.clear()
             self.view_realtime_btn.config(state="disabled")
             self.export_realtime_btn.config(state="disabled")
             self.clear_realtime_btn.config(state="disabled")